@@ -12,7 +12,9 @@ Public functions:
 - parse_html_file(...)
 - transform_parsed_file(...)
 - load_transformed_file(...)
-- run_full_etl(...)
+- run_full_etl_async(...)  (primary API; run_full_etl(...) wraps it)
+- run_full_etl_batch(...)
+- run_full_etl_many(...)
 
 Example usage:
 
@@ -27,20 +29,36 @@ Example usage:
         table_name="scrape_data",
         db_url=None,  # use DB_URL / POSTGRES_* from .env
     )
+
+    # Inside async code, await the coroutine instead:
+    #   await run_full_etl_async(keyword="BMW 3 Series", ...)
+
+    # Several keywords at once (paths derived from each keyword)
+    from engine import run_full_etl_batch
+
+    run_full_etl_batch(["BMW 3 Series", "Toyota Calya"])
 """
 
 import asyncio
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import Optional
 
 from dotenv import load_dotenv
 from loguru import logger
-from playwright.async_api import async_playwright
-
-from source.etl.etl_scraper import olx_scraper
+from playwright.async_api import Browser
+
+from source.etl.etl_scraper import (
+    HTML_CACHE_TTL_SECONDS,
+    PlaywrightSession,
+    is_html_fresh,
+    olx_scraper,
+)
 from source.etl.etl_parser import parse_html
 from source.etl.etl_transformer import ETLTransformer
-from source.etl.db_loader import load_data
+from source.etl.db_loader import load_data, reset_engines
+from source.etl.utils.etl_paths import default_paths, ensure_dirs
 
 from source.logging_config import configure_logging
 
@@ -57,8 +75,10 @@ async def scrape_html_async(
     keyword: str,
     html_path: str,
     location: str = "Indonesia",
-    headless: bool = False,
+    headless: bool = True,
     goto_timeout_ms: int = 60_000,
+    browser: Optional[Browser] = None,
+    cache_ttl_seconds: int = HTML_CACHE_TTL_SECONDS,
 ) -> None:
     """
     Asynchronous scraping function.
@@ -72,23 +92,38 @@ async def scrape_html_async(
     location : str, optional
         OLX location filter, default is "Indonesia".
     headless : bool, optional
-        Whether to run the browser in headless mode. Default False for easier
-        debugging.
+        Whether to run the browser in headless mode. Default True; pass False
+        to watch the browser while debugging. Ignored when `browser` is given.
     goto_timeout_ms : int, optional
         Timeout for page.goto() in milliseconds. Default is 60_000.
+    browser : playwright Browser | None, optional
+        Already-launched browser to reuse (e.g. from PlaywrightSession). If
+        None, a browser is launched for this call only.
+    cache_ttl_seconds : int, optional
+        Reuse an existing html_path scraped for the same keyword/location if
+        it is younger than this many seconds. 0 always re-scrapes. Default
+        is HTML_CACHE_TTL_SECONDS (env var, 6 hours).
     """
-    # --- Ensure output directory exists ---
-    out_dir = os.path.dirname(html_path)
-    if out_dir:
-        os.makedirs(out_dir, exist_ok=True)
+    if is_html_fresh(html_path, keyword, location, cache_ttl_seconds):
+        logger.info(f"[Engine] SCRAPE cache hit for '{keyword}': {html_path}")
+        return
 
-    async with async_playwright() as p:
+    if browser is not None:
         await olx_scraper(
-            playwright=p,
+            browser,
+            keyword=keyword,
+            html_path=html_path,
+            location=location,
+            goto_timeout_ms=goto_timeout_ms,
+        )
+        return
+
+    async with PlaywrightSession(headless=headless) as own_browser:
+        await olx_scraper(
+            own_browser,
             keyword=keyword,
             html_path=html_path,
             location=location,
-            headless=headless,
             goto_timeout_ms=goto_timeout_ms,
         )
 
@@ -97,7 +132,7 @@ def scrape_html(
     keyword: str,
     html_path: str,
     location: str = "Indonesia",
-    headless: bool = False,
+    headless: bool = True,
     goto_timeout_ms: int = 60_000,
 ) -> None:
     """
@@ -115,7 +150,7 @@ def scrape_html(
     location : str, optional
         OLX location filter, default is "Indonesia".
     headless : bool, optional
-        Whether to run the browser in headless mode. Default False.
+        Whether to run the browser in headless mode. Default True.
     goto_timeout_ms : int, optional
         Timeout for page.goto() in milliseconds. Default is 60_000.
     """
@@ -152,11 +187,6 @@ def parse_html_file(
     if not os.path.exists(html_path):
         raise FileNotFoundError(f"[Engine] HTML file not found: {html_path}")
 
-    # --- Ensure output directory exists ---
-    out_dir = os.path.dirname(parsed_path)
-    if out_dir:
-        os.makedirs(out_dir, exist_ok=True)
-
     with open(html_path, "r", encoding="utf-8") as f:
         html_data = f.read()
 
@@ -201,19 +231,21 @@ def transform_parsed_file(
 # --- 4) LOAD: CSV transformed → PostgreSQL + JSON inserted ---
 def load_transformed_file(
     transformed_path: str,
-    inserted_path: str,
+    inserted_path: Optional[str] = None,
     table_name: str = "scrape_data",
     db_url: Optional[str] = None,
 ) -> None:
     """
-    Load transformed CSV data into PostgreSQL and export inserted records to JSON.
+    Load transformed CSV data into PostgreSQL and optionally export inserted
+    records to JSON.
 
     Parameters
     ----------
     transformed_path : str
         Path to the transformed CSV file.
-    inserted_path : str
-        Path to the JSON file where inserted records will be stored.
+    inserted_path : str | None, optional
+        Path to the JSON file where inserted records will be stored. Default
+        None: no audit JSON is written.
     table_name : str, optional
         Name of the target table in the database. Default is "scrape_data".
     db_url : str | None, optional
@@ -225,11 +257,6 @@ def load_transformed_file(
         f"[Engine] Start LOAD: transformed={transformed_path} → table='{table_name}'"
     )
 
-    # --- Ensure output directory for JSON exists ---
-    out_dir = os.path.dirname(inserted_path)
-    if out_dir:
-        os.makedirs(out_dir, exist_ok=True)
-
     load_data(
         transformed_data=transformed_path,
         inserted_path=inserted_path,
@@ -243,22 +270,27 @@ def load_transformed_file(
 
 
 # --- 5) Helper: run full ETL pipeline in a single call ---
-def run_full_etl(
+async def run_full_etl_async(
     keyword: str,
     html_path: str,
     parsed_path: str,
     transformed_path: str,
-    inserted_path: str,
+    inserted_path: Optional[str] = None,
     table_name: str = "scrape_data",
     db_url: Optional[str] = None,
     location: str = "Indonesia",
-    headless: bool = False,
+    headless: bool = True,
     goto_timeout_ms: int = 60_000,
+    browser: Optional[Browser] = None,
 ) -> None:
     """
-    Run the complete ETL pipeline in one call:
+    Run the complete ETL pipeline as a coroutine:
     SCRAPE → PARSE → TRANSFORM → LOAD.
 
+    The scrape runs on the caller's event loop; the blocking PARSE, TRANSFORM
+    and LOAD steps run in worker threads, so several keywords can be awaited
+    together (e.g. with asyncio.gather) on one loop and one browser.
+
     Parameters
     ----------
     keyword : str
@@ -269,8 +301,8 @@ def run_full_etl(
         Path for the parsed CSV file.
     transformed_path : str
         Path for the transformed CSV file.
-    inserted_path : str
-        Path for the JSON file containing inserted records.
+    inserted_path : str | None, optional
+        Path for the JSON file containing inserted records. None skips it.
     table_name : str, optional
         Target table name in the database, default "scrape_data".
     db_url : str | None, optional
@@ -278,35 +310,45 @@ def run_full_etl(
     location : str, optional
         OLX location filter, default "Indonesia".
     headless : bool, optional
-        Whether to run the browser in headless mode. Default False.
+        Whether to run the browser in headless mode. Default True.
     goto_timeout_ms : int, optional
         Timeout for page.goto() in milliseconds. Default is 60_000.
+    browser : playwright Browser | None, optional
+        Already-launched browser to reuse (e.g. from PlaywrightSession). If
+        None, a browser is launched for the scrape only.
     """
     logger.info(f"[Engine] ===== START FULL ETL for keyword='{keyword}' =====")
 
+    # --- Create every output directory once, up front ---
+    ensure_dirs(html_path, parsed_path, transformed_path, inserted_path)
+
     # --- Step 1: SCRAPE ---
-    scrape_html(
+    await scrape_html_async(
         keyword=keyword,
         html_path=html_path,
         location=location,
         headless=headless,
         goto_timeout_ms=goto_timeout_ms,
+        browser=browser,
     )
 
     # --- Step 2: PARSE ---
-    parse_html_file(
+    await asyncio.to_thread(
+        parse_html_file,
         html_path=html_path,
         parsed_path=parsed_path,
     )
 
     # --- Step 3: TRANSFORM ---
-    transform_parsed_file(
+    await asyncio.to_thread(
+        transform_parsed_file,
         parsed_path=parsed_path,
         transformed_path=transformed_path,
     )
 
     # --- Step 4: LOAD ---
-    load_transformed_file(
+    await asyncio.to_thread(
+        load_transformed_file,
         transformed_path=transformed_path,
         inserted_path=inserted_path,
         table_name=table_name,
@@ -316,32 +358,287 @@ def run_full_etl(
     logger.info(f"[Engine] ===== FULL ETL DONE for keyword='{keyword}' =====")
 
 
+def run_full_etl(
+    keyword: str,
+    html_path: str,
+    parsed_path: str,
+    transformed_path: str,
+    inserted_path: Optional[str] = None,
+    table_name: str = "scrape_data",
+    db_url: Optional[str] = None,
+    location: str = "Indonesia",
+    headless: bool = True,
+    goto_timeout_ms: int = 60_000,
+) -> None:
+    """
+    Synchronous wrapper for `run_full_etl_async`, for scripts and the CLI.
+
+    See `run_full_etl_async` for the parameters.
+    """
+    asyncio.run(
+        run_full_etl_async(
+            keyword=keyword,
+            html_path=html_path,
+            parsed_path=parsed_path,
+            transformed_path=transformed_path,
+            inserted_path=inserted_path,
+            table_name=table_name,
+            db_url=db_url,
+            location=location,
+            headless=headless,
+            goto_timeout_ms=goto_timeout_ms,
+        )
+    )
+
+
+# --- 6) Helper: run many keywords as a concurrent pipeline ---
+def _parse_and_transform(
+    html_path: str,
+    parsed_path: str,
+    transformed_path: str,
+) -> None:
+    """
+    CPU-bound leg (PARSE → TRANSFORM) for one keyword, run in a worker process.
+    """
+    parse_html_file(html_path=html_path, parsed_path=parsed_path)
+    transform_parsed_file(parsed_path=parsed_path, transformed_path=transformed_path)
+
+
+async def run_full_etl_batch_async(
+    keywords: list[str],
+    table_name: str = "scrape_data",
+    db_url: Optional[str] = None,
+    location: str = "Indonesia",
+    headless: bool = True,
+    goto_timeout_ms: int = 60_000,
+    max_concurrent_scrapes: int = 3,
+    max_workers: Optional[int] = None,
+) -> None:
+    """
+    Run the ETL pipeline for several keywords concurrently.
+
+    Scrapes run as concurrent asyncio tasks on one shared browser (bounded by
+    max_concurrent_scrapes). As soon as one keyword's HTML is saved, its
+    PARSE → TRANSFORM leg is handed to a process pool while other scrapes keep
+    going, and its LOAD runs in a thread sharing the pooled DB engine.
+    Artifact paths are derived from each keyword via default_paths().
+
+    Parameters
+    ----------
+    keywords : list[str]
+        Car search keywords, e.g. ["BMW 3 Series", "Toyota Calya"].
+    table_name : str, optional
+        Target table name in the database, default "scrape_data".
+    db_url : str | None, optional
+        Database URL; if None, it will be derived from environment variables.
+    location : str, optional
+        OLX location filter, default "Indonesia".
+    headless : bool, optional
+        Whether to run the browser in headless mode. Default True.
+    goto_timeout_ms : int, optional
+        Timeout for page.goto() in milliseconds. Default is 60_000.
+    max_concurrent_scrapes : int, optional
+        Maximum number of browsers scraping at the same time. Default 3.
+    max_workers : int | None, optional
+        Size of the parse/transform process pool. Default os.cpu_count().
+    """
+    logger.info(f"[Engine] ===== START BATCH ETL for {len(keywords)} keywords =====")
+
+    loop = asyncio.get_running_loop()
+    scrape_slots = asyncio.Semaphore(max_concurrent_scrapes)
+
+    # --- Create every output directory once, up front ---
+    ensure_dirs(*(p for kw in keywords for p in default_paths(kw).values()))
+
+    # spawn: forking a process that already runs an event loop and Playwright
+    # threads can deadlock the children.
+    with ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+
+        async def _run_one(keyword: str) -> None:
+            paths = default_paths(keyword)
+
+            # --- SCRAPE (I/O-bound, concurrent) ---
+            async with scrape_slots:
+                await scrape_html_async(
+                    keyword=keyword,
+                    html_path=paths["html_path"],
+                    location=location,
+                    headless=headless,
+                    goto_timeout_ms=goto_timeout_ms,
+                    browser=browser,
+                )
+
+            # --- PARSE + TRANSFORM (CPU-bound, process pool) ---
+            await loop.run_in_executor(
+                pool,
+                _parse_and_transform,
+                paths["html_path"],
+                paths["parsed_path"],
+                paths["transformed_path"],
+            )
+
+            # --- LOAD (thread, shared pooled engine) ---
+            await asyncio.to_thread(
+                load_transformed_file,
+                transformed_path=paths["transformed_path"],
+                inserted_path=paths["inserted_path"],
+                table_name=table_name,
+                db_url=db_url,
+            )
+            logger.info(f"[Engine] BATCH item done for keyword='{keyword}'")
+
+        # --- One browser shared by every scrape in the batch ---
+        async with PlaywrightSession(headless=headless) as browser:
+            # One failing keyword must not cancel the others
+            results = await asyncio.gather(
+                *(_run_one(keyword) for keyword in keywords),
+                return_exceptions=True,
+            )
+
+    failed: list[str] = []
+    for keyword, result in zip(keywords, results):
+        if isinstance(result, BaseException):
+            logger.error(f"[Engine] BATCH ETL failed for keyword='{keyword}': {result}")
+            failed.append(keyword)
+
+    if failed:
+        raise RuntimeError(f"[Engine] BATCH ETL failed for keywords: {failed}")
+
+    logger.info(f"[Engine] ===== BATCH ETL DONE for {len(keywords)} keywords =====")
+
+
+def run_full_etl_batch(
+    keywords: list[str],
+    table_name: str = "scrape_data",
+    db_url: Optional[str] = None,
+    location: str = "Indonesia",
+    headless: bool = True,
+    goto_timeout_ms: int = 60_000,
+    max_concurrent_scrapes: int = 3,
+    max_workers: Optional[int] = None,
+) -> None:
+    """
+    Synchronous wrapper for `run_full_etl_batch_async`.
+
+    See `run_full_etl_batch_async` for the parameters.
+    """
+    asyncio.run(
+        run_full_etl_batch_async(
+            keywords=keywords,
+            table_name=table_name,
+            db_url=db_url,
+            location=location,
+            headless=headless,
+            goto_timeout_ms=goto_timeout_ms,
+            max_concurrent_scrapes=max_concurrent_scrapes,
+            max_workers=max_workers,
+        )
+    )
+
+
+# --- 7) Helper: run many keywords, one full ETL per worker process ---
+def _init_etl_worker() -> None:
+    """
+    Process-pool initializer: set up logging, env and a fresh DB engine pool.
+    """
+    configure_logging()
+    load_dotenv()
+    reset_engines()
+
+
+def run_full_etl_many(
+    keywords: list[str],
+    workers: Optional[int] = os.cpu_count(),
+    table_name: str = "scrape_data",
+    db_url: Optional[str] = None,
+    location: str = "Indonesia",
+    headless: bool = True,
+    goto_timeout_ms: int = 60_000,
+) -> None:
+    """
+    Run `run_full_etl` for several keywords in parallel worker processes.
+
+    Each keyword runs the whole SCRAPE → PARSE → TRANSFORM → LOAD chain in
+    its own process (own browser, own pooled DB engine), with artifact paths
+    derived via default_paths(). Keywords write to separate files and rows
+    get their own primary keys, so workers never contend on the same data.
+    A failing keyword does not stop the others; failures are reported at
+    the end.
+
+    Parameters
+    ----------
+    keywords : list[str]
+        Car search keywords, e.g. ["BMW 3 Series", "Toyota Calya"].
+    workers : int | None, optional
+        Number of worker processes. Default os.cpu_count().
+    table_name : str, optional
+        Target table name in the database, default "scrape_data".
+    db_url : str | None, optional
+        Database URL; if None, it will be derived from environment variables.
+    location : str, optional
+        OLX location filter, default "Indonesia".
+    headless : bool, optional
+        Whether to run the browser in headless mode. Default True.
+    goto_timeout_ms : int, optional
+        Timeout for page.goto() in milliseconds. Default is 60_000.
+    """
+    logger.info(
+        f"[Engine] ===== START PARALLEL ETL for {len(keywords)} keywords "
+        f"(workers={workers}) ====="
+    )
+
+    failed: list[str] = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_etl_worker) as pool:
+        futures = {
+            pool.submit(
+                run_full_etl,
+                keyword=keyword,
+                **default_paths(keyword),
+                table_name=table_name,
+                db_url=db_url,
+                location=location,
+                headless=headless,
+                goto_timeout_ms=goto_timeout_ms,
+            ): keyword
+            for keyword in keywords
+        }
+
+        for future in as_completed(futures):
+            keyword = futures[future]
+            error = future.exception()
+            if error is not None:
+                logger.error(f"[Engine] ETL failed for keyword='{keyword}': {error}")
+                failed.append(keyword)
+
+    if failed:
+        raise RuntimeError(f"[Engine] ETL failed for keywords: {failed}")
+
+    logger.info(f"[Engine] ===== PARALLEL ETL DONE for {len(keywords)} keywords =====")
+
+
 if __name__ == "__main__":
     # --- Simple CLI entry point (optional) ---
     #
     # Example:
     #   python engine.py "BMW 3 Series"
+    #   python engine.py "BMW 3 Series" "Toyota Calya"   # concurrent batch
     #
     import sys
 
     if len(sys.argv) < 2:
-        print("Usage: python engine.py '<keyword>'")
+        print("Usage: python engine.py '<keyword>' ['<keyword>' ...]")
         sys.exit(1)
 
-    kw = sys.argv[1]
+    kws = sys.argv[1:]
 
-    base = kw.replace(" ", "_").lower()
-    html = f"data/raw_html/{base}.html"
-    parsed = f"data/parsed/{base}.csv"
-    transformed = f"data/transformed/{base}_transformed.csv"
-    inserted = f"data/inserted/{base}_inserted.json"
-
-    run_full_etl(
-        keyword=kw,
-        html_path=html,
-        parsed_path=parsed,
-        transformed_path=transformed,
-        inserted_path=inserted,
-        table_name="scrape_data",
-        db_url=None,
-    )
+    if len(kws) > 1:
+        run_full_etl_batch(kws, table_name="scrape_data", db_url=None)
+    else:
+        run_full_etl(
+            keyword=kws[0],
+            **default_paths(kws[0]),
+            table_name="scrape_data",
+            db_url=None,
+        )
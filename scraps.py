@@ -17,6 +17,12 @@ python scraps.py Load \
   --parsed-path data/parsed/pajero.csv \
   --transformed-path data/transformed/pajero_transformed.csv \
   --inserted-path data/inserted/pajero_inserted.json
+
+Several keywords (one shared browser, then parallel Parse/Transform/Load):
+
+python scraps.py LoadBatch \
+  --local-scheduler --workers 8 \
+  --keywords '["Mitsubishi Pajero Sport", "Toyota Calya"]'
 """
 
 import os
@@ -26,14 +32,20 @@ import luigi
 import pandas as pd
 from dotenv import load_dotenv
 from loguru import logger
-from playwright.async_api import async_playwright
 
 from source.logging_config import configure_logging
 
-from source.etl.etl_scraper import olx_scraper
+from source.etl.etl_scraper import (
+    HTML_CACHE_TTL_SECONDS,
+    PlaywrightSession,
+    is_html_fresh,
+    olx_scraper,
+    olx_scraper_many,
+)
 from source.etl.etl_parser import parse_html
 from source.etl.etl_transformer import ETLTransformer
 from source.etl.db_loader import load_data
+from source.etl.utils.etl_paths import default_paths
 
 # Load environment variables (.env) for DB_URL, POSTGRES_*, etc.
 load_dotenv()
@@ -44,6 +56,25 @@ logger.add(lambda msg: print(msg, end=""), level="INFO")
 # File logger for detailed debugging
 configure_logging()
 
+# Event loop shared by the async tasks of this worker process
+_LOOP: asyncio.AbstractEventLoop | None = None
+_LOOP_PID: int | None = None
+
+
+def run_async(coro):
+    """
+    Run a coroutine on this process's shared event loop.
+
+    Unlike asyncio.run(), the loop is created once and reused by every task
+    the worker runs. Luigi forks a process per task when --workers > 1, so a
+    loop inherited from another process is never reused.
+    """
+    global _LOOP, _LOOP_PID
+    if _LOOP is None or _LOOP.is_closed() or _LOOP_PID != os.getpid():
+        _LOOP = asyncio.new_event_loop()
+        _LOOP_PID = os.getpid()
+    return _LOOP.run_until_complete(coro)
+
 
 class Scrape(luigi.Task):
     """
@@ -60,15 +91,22 @@ class Scrape(luigi.Task):
     def output(self):
         return luigi.LocalTarget(self.html_path)
 
-    def run(self):
-        os.makedirs(os.path.dirname(self.html_path), exist_ok=True)
+    def complete(self):
+        # With caching on, done only while the cached HTML is fresh (see
+        # HTML_CACHE_TTL_SECONDS); with it off, plain Luigi output check.
+        if not self.output().exists():
+            return False
+        return HTML_CACHE_TTL_SECONDS <= 0 or is_html_fresh(
+            self.html_path, self.keyword
+        )
 
+    def run(self):
         async def _run_scrape():
-            async with async_playwright() as p:
-                await olx_scraper(p, self.keyword, self.html_path)
+            async with PlaywrightSession() as browser:
+                await olx_scraper(browser, self.keyword, self.html_path)
 
         logger.info(f"[Scrape] Start scraping for keyword='{self.keyword}'")
-        asyncio.run(_run_scrape())
+        run_async(_run_scrape())
 
         # Check if HTML file was successfully created
         if not os.path.exists(self.html_path):
@@ -101,8 +139,6 @@ class Parse(luigi.Task):
         return luigi.LocalTarget(self.parsed_path)
 
     def run(self):
-        os.makedirs(os.path.dirname(self.parsed_path), exist_ok=True)
-
         logger.info(f"[Parse] Reading HTML from {self.input().path}")
         with self.input().open("r") as f:
             html_data = f.read()
@@ -182,8 +218,6 @@ class Load(luigi.Task):
         return luigi.LocalTarget(self.inserted_path)
 
     def run(self):
-        os.makedirs(os.path.dirname(self.inserted_path), exist_ok=True)
-
         logger.info(f"[Load] Loading data into DB from {self.input().path}")
         # db_url=None → will use DB_URL / POSTGRES_* from .env
         load_data(
@@ -195,6 +229,77 @@ class Load(luigi.Task):
         logger.info(f"[Load] Inserted data JSON saved to {self.output().path}")
 
 
+# --- 5) Batch Tasks
+class ScrapeBatch(luigi.Task):
+    """
+    Luigi Task: scrape several keywords with one shared browser.
+
+    Parameters:
+    - keywords: JSON list of search keywords
+    """
+
+    keywords = luigi.ListParameter()
+
+    def output(self):
+        return {
+            kw: luigi.LocalTarget(default_paths(kw)["html_path"])
+            for kw in self.keywords
+        }
+
+    def complete(self):
+        return all(
+            target.exists()
+            and (HTML_CACHE_TTL_SECONDS <= 0 or is_html_fresh(target.path, kw))
+            for kw, target in self.output().items()
+        )
+
+    def run(self):
+        html_paths = {}
+        for kw, target in self.output().items():
+            if is_html_fresh(target.path, kw):
+                logger.info(f"[ScrapeBatch] Cache hit for '{kw}', skip")
+                continue
+            html_paths[kw] = target.path
+
+        async def _run_scrapes():
+            async with PlaywrightSession() as browser:
+                await olx_scraper_many(browser, html_paths)
+
+        logger.info(f"[ScrapeBatch] Start scraping {len(html_paths)} keywords")
+        run_async(_run_scrapes())
+
+
+class LoadBatch(luigi.Task):
+    """
+    Luigi Task: run Load for several keywords.
+
+    ScrapeBatch runs first and owns the only browser. Its HTML files make
+    every per-keyword Scrape complete (fresh within HTML_CACHE_TTL_SECONDS,
+    or simply present when the cache is disabled with 0), so the
+    Parse → Transform → Load chains yielded here need no browser and, with
+    --workers N, run in parallel.
+    Paths are derived from each keyword (see default_paths).
+
+    Parameters:
+    - keywords: JSON list of search keywords
+    """
+
+    keywords = luigi.ListParameter()
+
+    def requires(self):
+        return ScrapeBatch(keywords=self.keywords)
+
+    def output(self):
+        return [
+            luigi.LocalTarget(default_paths(kw)["inserted_path"])
+            for kw in self.keywords
+        ]
+
+    def run(self):
+        # Dynamic dependencies: scheduled once the shared scrape is done
+        yield [Load(keyword=kw, **default_paths(kw)) for kw in self.keywords]
+
+
 if __name__ == "__main__":
     # Run Luigi CLI
     luigi.run()
@@ -1,11 +1,78 @@
+import io
+import math
 import os
-import json
-from typing import Union
-
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from typing import Self, Union
+
+import numpy as np
+import orjson
 import pandas as pd
+from pandas.api.types import is_numeric_dtype
 from loguru import logger
+from psycopg2.extras import execute_values
 from sqlalchemy import create_engine, MetaData, Table
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import NoSuchTableError, SQLAlchemyError
+
+from source.etl.utils.etl_paths import ensure_dirs
+
+# NULL marker used in COPY CSV payloads
+_COPY_NULL = "\\N"
+
+# Rows per chunk when reading / loading transformed data
+CHUNK_SIZE = 50_000
+
+# Target table columns and their dtypes when read from the transformed CSV.
+# Only these columns are loaded; helper columns (e.g. installment_imputed)
+# are never read. Numeric columns are read as object and converted on
+# normalization, so one malformed cell becomes NULL (with a warning) instead
+# of failing the whole read.
+DB_DTYPES = {
+    "title": "object",
+    "price": "object",
+    "listing_url": "object",
+    "location": "object",
+    "installment": "object",
+    "posted_time": "object",
+    "year": "object",
+    "lower_km": "object",
+    "upper_km": "object",
+}
+
+# Columns stored as floating point in the target table
+FLOAT_COLUMNS = ("price", "installment", "lower_km", "upper_km")
+
+# Rows per multi-row INSERT statement in the psycopg2 fallback
+EXECUTE_VALUES_PAGE_SIZE = 1_000
+
+# Loads with drop_indexes=True drop secondary indexes once they pass this size
+DROP_INDEXES_MIN_ROWS = 100_000
+
+# Connections kept open per pooled engine (see get_engine)
+POOL_SIZE = 5
+
+# Secondary (non-unique, non-constraint) indexes of a table, with their
+# definitions. Unique indexes are never dropped: while they are rebuilt
+# after the commit, nothing would enforce uniqueness.
+_SECONDARY_INDEXES_SQL = """
+SELECT quote_ident(n.nspname) || '.' || quote_ident(ic.relname),
+       pg_get_indexdef(ix.indexrelid)
+FROM pg_index ix
+JOIN pg_class ic ON ic.oid = ix.indexrelid
+JOIN pg_namespace n ON n.oid = ic.relnamespace
+WHERE ix.indrelid = to_regclass(%s)
+  AND NOT ix.indisunique
+  AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = ix.indexrelid)
+"""
+
+# Pooled engines, one per database URL, reused across loads
+_ENGINES: dict[str, Engine] = {}
+# Guards engine creation: LOAD steps may run concurrently in threads
+_ENGINES_LOCK = threading.Lock()
 
 
 def get_db_url(db_url: str | None = None) -> str:
@@ -34,23 +101,81 @@ def get_db_url(db_url: str | None = None) -> str:
     db = os.getenv("POSTGRES_DB", "scrape-olx")
     host = os.getenv("POSTGRES_HOST", "localhost")
     port = os.getenv("POSTGRES_PORT", "5435")
+    driver = os.getenv("POSTGRES_DRIVER", "psycopg2")  # or "psycopg" (v3)
 
-    url = f"postgresql+psycopg2://{user}:{password}@{host}:{port}/{db}"
-    safe_url = f"postgresql+psycopg2://{user}:***@{host}:{port}/{db}"
+    url = f"postgresql+{driver}://{user}:{password}@{host}:{port}/{db}"
+    safe_url = f"postgresql+{driver}://{user}:***@{host}:{port}/{db}"
     logger.info(f"[DB] Built DB URL from env: {safe_url}")
     return url
 
 
+def get_engine(db_url: str) -> Engine:
+    """
+    Return the shared SQLAlchemy engine for db_url, creating it on first use.
+
+    The engine's connection pool is kept alive across loads so repeated
+    DBLoader.load calls (e.g. many Luigi tasks in one worker) skip the TCP
+    and authentication handshake.
+    """
+    engine = _ENGINES.get(db_url)
+    if engine is None:
+        with _ENGINES_LOCK:
+            # Re-check: another thread may have built it while we waited
+            engine = _ENGINES.get(db_url)
+            if engine is None:
+                engine = create_engine(db_url, pool_size=POOL_SIZE, pool_pre_ping=True)
+                _ENGINES[db_url] = engine
+    return engine
+
+
+def reset_engines() -> None:
+    """
+    Forget engines inherited from a parent process.
+
+    Runs automatically in every forked child (see register_at_fork below):
+    pooled connections must not be shared across processes, so each worker
+    builds its own engine on first use. Inherited connections are left for
+    the parent to close.
+    """
+    global _ENGINES_LOCK
+    # The parent may have held the lock at fork time
+    _ENGINES_LOCK = threading.Lock()
+    for engine in _ENGINES.values():
+        engine.dispose(close=False)
+    _ENGINES.clear()
+    _reflect_table.cache_clear()
+
+
+@cache
+def _reflect_table(engine: Engine, table_name: str) -> Table:
+    """
+    Reflect a single table once per (engine, table) and reuse the result.
+
+    Engines are cached per URL by get_engine(), so this is effectively keyed
+    by (db_url, table_name). Failed lookups are not cached.
+    """
+    try:
+        return Table(table_name, MetaData(), autoload_with=engine)
+    except NoSuchTableError as e:
+        raise RuntimeError(f"[Load] Table '{table_name}' not found in database.") from e
+
+
+# Forked children (Luigi --workers N, process pools) must not reuse the
+# parent's pooled connections: the shared socket would hang or corrupt both.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=reset_engines)
+
+
 class DBLoader:
     """
     Database Loader for inserting transformed OLX data into PostgreSQL.
 
     Responsibilities:
-    - Load transformed CSV or DataFrame
+    - Load transformed CSV or DataFrame in chunks
     - Clean data (NaN → NULL, year → int)
-    - Drop helper columns not present in DB schema
-    - Insert records using SQLAlchemy with transaction support
-    - Save inserted rows to a JSON file for auditing
+    - Keep only DB schema columns (helper columns are never read)
+    - Bulk load rows with PostgreSQL COPY, falling back to SQLAlchemy INSERT
+    - Optionally save inserted rows to a JSON file for auditing
     """
 
     def __init__(self, db_url: str | None = None):
@@ -65,65 +190,365 @@ class DBLoader:
         self.db_url = get_db_url(db_url)
 
     @staticmethod
-    def _normalize_record(raw: dict) -> dict:
+    def _normalize_frame(df: pd.DataFrame) -> pd.DataFrame:
         """
-        Normalize a row dict before inserting into DB.
+        Normalize a DataFrame before inserting into DB, keeping typed columns.
 
         Rules:
-        - pd.NA / NaN → None
-        - 'year' column → cast to int, if fail set to None
+        - 'year' column → nullable Int64 (truncated), invalid values → <NA>
+        - FLOAT_COLUMNS read as object → float64, invalid values → NaN
+        - object columns: NaN → None
+        - numeric columns keep their dtype (missing stays NaN / <NA>); each
+          write path maps those to NULL itself, so no column is upcast to
+          Python objects here
         """
+        for col in FLOAT_COLUMNS:
+            if col in df.columns and df[col].dtype == object:
+                values = pd.to_numeric(df[col], errors="coerce").astype("float64")
+                n_coerced = int((values.isna() & df[col].notna()).sum())
+                if n_coerced:
+                    logger.warning(
+                        f"[Load] {n_coerced} invalid '{col}' values set to NULL"
+                    )
+                df = df.assign(**{col: values})
+
+        if "year" in df.columns:
+            year = pd.to_numeric(df["year"], errors="coerce")
+            year = year.where(np.isfinite(year))
 
-        def _norm(key: str, value):
-            # --- Treat explicit None as is ---
-            if value is None:
-                return None
+            # One summary line per chunk instead of a warning per row
+            n_coerced = int((year.isna() & df["year"].notna()).sum())
+            if n_coerced:
+                logger.warning(f"[Load] {n_coerced} invalid 'year' values set to NULL")
 
-            # --- Pandas missing markers (pd.NA, NaN) -> None ---
-            if value is pd.NA or (isinstance(value, float) and pd.isna(value)):
-                return None
+            df = df.assign(year=np.trunc(year).astype("Int64"))
 
-            # --- Special handling for 'year' (INT column in DB) ---
-            if key == "year":
+        # --- Only object columns need NaN → None ---
+        object_cols = df.columns[df.dtypes == object]
+        if len(object_cols):
+            df = df.assign(
+                **{col: df[col].where(df[col].notna(), None) for col in object_cols}
+            )
+        return df
+
+    @staticmethod
+    def _iter_chunks(
+        transformed_data: Union[str, pd.DataFrame],
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Yield normalized, DB-ready chunks of at most CHUNK_SIZE rows, keeping
+        only the target table columns (DB_DTYPES).
+
+        CSV input is read with pd.read_csv(chunksize=...) and explicit dtypes,
+        so only one chunk of a large transformed file is in memory at a time
+        and a malformed number only nulls its own cell. A '.parquet' path is read
+        batch by batch with pyarrow.
+        """
+        if isinstance(transformed_data, pd.DataFrame):
+            # Column selection already returns a new frame and normalization
+            # never mutates in place, so the caller's DataFrame is not copied.
+            source = transformed_data[
+                [c for c in transformed_data.columns if c in DB_DTYPES]
+            ]
+            frames = (
+                source.iloc[start : start + CHUNK_SIZE]
+                for start in range(0, len(source), CHUNK_SIZE)
+            )
+        elif transformed_data.endswith(".parquet"):
+            frames = _iter_parquet(transformed_data)
+        else:
+            frames = pd.read_csv(
+                transformed_data,
+                dtype=DB_DTYPES,
+                usecols=lambda c: c in DB_DTYPES,
+                engine="c",
+                chunksize=CHUNK_SIZE,
+            )
+
+        for idx, df in enumerate(frames):
+            if idx == 0:
+                logger.debug(f"[Load] DataFrame dtypes before cleaning:\n{df.dtypes}")
+
+            yield DBLoader._normalize_frame(df)
+
+    @staticmethod
+    def _copy_frame(cur, engine: Engine, df: pd.DataFrame, table_name: str) -> None:
+        """
+        Stream a normalized DataFrame into table_name with COPY ... FROM STDIN
+        (CSV format) on an open DBAPI cursor. Transaction handling is left to
+        the caller.
+        """
+        quote = engine.dialect.identifier_preparer.quote
+        cols = ", ".join(quote(c) for c in df.columns)
+        sql = (
+            f"COPY {quote(table_name)} ({cols}) "
+            f"FROM STDIN WITH (FORMAT csv, NULL '{_COPY_NULL}')"
+        )
+
+        if engine.dialect.driver == "psycopg":
+            # psycopg 3 copy API
+            with cur.copy(sql) as copy:
+                for line in _csv_lines(df):
+                    copy.write(line)
+        else:
+            # psycopg2 copy API
+            cur.copy_expert(sql, StringIteratorIO(_csv_lines(df)))
+
+    @staticmethod
+    def _drop_secondary_indexes(cur, engine: Engine, table_name: str) -> list[str]:
+        """
+        DROP the table's non-unique, non-constraint indexes on an open DBAPI
+        cursor and return their CREATE INDEX definitions.
+
+        Runs inside the caller's transaction, so a rollback restores them.
+        """
+        cur.execute(
+            _SECONDARY_INDEXES_SQL,
+            (engine.dialect.identifier_preparer.quote(table_name),),
+        )
+        indexes = cur.fetchall()
+        for name, _ in indexes:
+            cur.execute(f"DROP INDEX {name}")
+
+        logger.info(
+            f"[Load] Dropped {len(indexes)} indexes on '{table_name}' for bulk load"
+        )
+        return [indexdef for _, indexdef in indexes]
+
+    @staticmethod
+    def _recreate_indexes(engine: Engine, indexdefs: list[str]) -> None:
+        """
+        Rebuild dropped indexes in parallel, one statement per pooled
+        connection in autocommit mode, at most POOL_SIZE at a time.
+
+        Plain CREATE INDEX is used: its SHARE lock lets builds on the same
+        table run side by side, whereas concurrent CREATE INDEX CONCURRENTLY
+        builds on one table wait on each other and deadlock.
+        """
+
+        def _create(indexdef: str) -> None:
+            with engine.connect().execution_options(
+                isolation_level="AUTOCOMMIT"
+            ) as conn:
+                # DBAPI cursor: index definitions may contain '%' literals
+                cur = conn.connection.driver_connection.cursor()
                 try:
-                    # allow float 2015.0 or string "2015"
-                    return int(float(value))
-                except (TypeError, ValueError, OverflowError) as e:
-                    logger.warning(
-                        f"[Load] Invalid 'year' value {value!r} "
-                        f"({type(value)}): {e}. Stored as NULL."
+                    cur.execute(indexdef)
+                finally:
+                    cur.close()
+
+        with ThreadPoolExecutor(max_workers=min(len(indexdefs), POOL_SIZE)) as pool:
+            futures = {pool.submit(_create, d): d for d in indexdefs}
+
+        failed = []
+        for future, indexdef in futures.items():
+            if future.exception() is not None:
+                logger.error(f"[Load] {indexdef} failed: {future.exception()}")
+                failed.append(indexdef)
+        if failed:
+            # The data is already committed: print what to run by hand
+            recovery = "\n".join(f"{d};" for d in failed)
+            logger.error(f"[Load] Run these statements to restore indexes:\n{recovery}")
+            raise RuntimeError(f"[Load] Failed to recreate indexes: {failed}")
+
+        logger.info(f"[Load] Recreated {len(indexdefs)} indexes")
+
+    def _copy_chunks(
+        self,
+        engine: Engine,
+        chunks: Iterable[pd.DataFrame],
+        table_name: str,
+        audit: "_JsonArrayWriter | None",
+        dropped_indexes: list[str] | None = None,
+    ) -> int:
+        """
+        COPY every chunk inside one transaction on a raw DBAPI connection:
+        committed after the last chunk, rolled back on any error.
+
+        If dropped_indexes is a list, secondary indexes are dropped (inside
+        the transaction) once more than DROP_INDEXES_MIN_ROWS rows are loaded,
+        and their definitions are appended to the list for recreation.
+
+        Returns the number of rows loaded.
+        """
+        raw = None
+        n_rows = 0
+        indexes_dropped = False
+        try:
+            for df in chunks:
+                if df.empty:
+                    continue
+                if raw is None:
+                    # Connect lazily: empty input never touches the database
+                    raw = engine.raw_connection()
+                    cur = raw.cursor()
+
+                if (
+                    dropped_indexes is not None
+                    and not indexes_dropped
+                    and n_rows + len(df) > DROP_INDEXES_MIN_ROWS
+                ):
+                    dropped_indexes.extend(
+                        self._drop_secondary_indexes(cur, engine, table_name)
                     )
-                    return None
+                    indexes_dropped = True
+
+                self._copy_frame(cur, engine, df, table_name)
+                if audit is not None:
+                    audit.write(df.to_dict(orient="records"))
+                n_rows += len(df)
+                logger.debug(f"[Load] COPY chunk done, {n_rows} rows so far")
+
+            if raw is not None:
+                cur.close()
+                raw.commit()
+        except Exception:
+            if raw is not None:
+                raw.rollback()
+            if dropped_indexes:
+                # Rollback restored the dropped indexes: nothing to recreate
+                dropped_indexes.clear()
+            raise
+        finally:
+            if raw is not None:
+                raw.close()
+
+        return n_rows
 
-            # --- Default: keep original value ---
-            return value
+    @staticmethod
+    def _insert_prefix(engine: Engine, df: pd.DataFrame, table_name: str) -> str:
+        """
+        Build 'INSERT INTO "table" ("col", ...) VALUES ' for df's columns.
+        """
+        quote = engine.dialect.identifier_preparer.quote
+        cols = ", ".join(quote(c) for c in df.columns)
+        return f"INSERT INTO {quote(table_name)} ({cols}) VALUES "
 
-        return {k: _norm(k, v) for k, v in raw.items()}
+    @classmethod
+    def _pipeline_insert(
+        cls, conn, engine: Engine, df: pd.DataFrame, table_name: str
+    ) -> None:
+        """
+        INSERT a normalized DataFrame with psycopg 3 pipeline mode on the
+        DBAPI connection behind conn, so all rows go out in one network
+        flush instead of one round-trip per row. Runs inside conn's
+        transaction.
+        """
+        params = ", ".join(["%s"] * len(df.columns))
+        sql = cls._insert_prefix(engine, df, table_name) + f"({params})"
+
+        driver_conn = conn.connection.driver_connection
+        with driver_conn.pipeline(), driver_conn.cursor() as cur:
+            cur.executemany(sql, list(df.itertuples(index=False, name=None)))
+
+    @classmethod
+    def _execute_values_insert(
+        cls, conn, engine: Engine, df: pd.DataFrame, table_name: str
+    ) -> None:
+        """
+        INSERT a normalized DataFrame with psycopg2's execute_values: one
+        multi-row 'INSERT ... VALUES (...), (...)' statement per page of
+        EXECUTE_VALUES_PAGE_SIZE rows. Runs inside conn's transaction.
+        """
+        sql = cls._insert_prefix(engine, df, table_name) + "%s"
+
+        cur = conn.connection.driver_connection.cursor()
+        try:
+            execute_values(
+                cur,
+                sql,
+                df.itertuples(index=False, name=None),
+                page_size=EXECUTE_VALUES_PAGE_SIZE,
+            )
+        finally:
+            cur.close()
+
+    @classmethod
+    def _insert_chunks(
+        cls,
+        engine: Engine,
+        chunks: Iterable[pd.DataFrame],
+        table_name: str,
+        audit: "_JsonArrayWriter | None",
+    ) -> int:
+        """
+        Insert every chunk inside one transaction (fallback path), using the
+        fastest multi-row INSERT the driver offers:
+
+        - psycopg (3)  → pipeline mode
+        - psycopg2     → execute_values
+        - other        → SQLAlchemy Table.insert()
+
+        Returns the number of rows inserted.
+        """
+        n_rows = 0
+        driver = engine.dialect.driver
+
+        # Use transaction context – auto commit/rollback
+        with engine.begin() as conn:
+            for df in chunks:
+                if df.empty:
+                    continue
+
+                # Reflection (cached) validates the table and its name
+                table = _reflect_table(engine, table_name)
+
+                # DBAPI parameters need plain Python values with None for NULL
+                values = _db_values(df)
+                try:
+                    if driver == "psycopg":
+                        cls._pipeline_insert(conn, engine, values, table.name)
+                    elif driver == "psycopg2":
+                        cls._execute_values_insert(conn, engine, values, table.name)
+                    else:
+                        conn.execute(table.insert(), values.to_dict(orient="records"))
+                except (SQLAlchemyError, engine.dialect.loaded_dbapi.Error) as e:
+                    logger.error(
+                        f"[Load] Error while inserting into '{table_name}': {e}"
+                    )
+                    raise RuntimeError(
+                        f"Error while inserting into '{table_name}': {e}"
+                    ) from e
+
+                if audit is not None:
+                    audit.write(df.to_dict(orient="records"))
+                n_rows += len(df)
+
+        return n_rows
 
     def load(
         self,
         transformed_data: Union[str, pd.DataFrame],
-        inserted_path: str,
-        table_name: str,
+        inserted_path: str | None = None,
+        table_name: str = "scrape_data",
+        drop_indexes: bool = False,
     ) -> None:
         """
         Load transformed data into PostgreSQL table.
 
+        Data is processed in chunks of CHUNK_SIZE rows, all loaded in a single
+        transaction, and the optional JSON audit file is written as chunks
+        succeed.
+
         Parameters
         ----------
         transformed_data : str | pd.DataFrame
             File path to CSV or in-memory DataFrame
-        inserted_path : str
-            JSON file path to save inserted records
+        inserted_path : str | None
+            JSON file path to save inserted records. If None (default), no
+            audit file is written.
         table_name : str
-            Name of the target database table
+            Name of the target database table, default "scrape_data"
+        drop_indexes : bool
+            For loads above DROP_INDEXES_MIN_ROWS rows, drop the table's
+            secondary indexes during COPY and rebuild them in parallel
+            afterwards. Default False.
         """
 
-        # --- 1) Load transformed data ---
+        # --- 1) Validate input source ---
         if isinstance(transformed_data, pd.DataFrame):
-            df = transformed_data.copy()
             logger.info(
-                f"[Load] Using in-memory DataFrame with {len(df)} rows "
+                f"[Load] Using in-memory DataFrame with {len(transformed_data)} rows "
                 f"to insert into '{table_name}'"
             )
         else:
@@ -133,104 +558,194 @@ class DBLoader:
                 f"[Load] Reading transformed CSV from '{transformed_data}' "
                 f"for table '{table_name}'"
             )
-            df = pd.read_csv(transformed_data)
-
-        # --- 2) Skip if no data ---
-        if df.empty:
-            logger.info("[Load] No data to insert. Skipping DB insert.")
-            _ensure_dir(inserted_path)
-            with open(inserted_path, "w", encoding="utf-8") as f:
-                json.dump([], f, ensure_ascii=False, indent=2)
-            return
 
-        logger.debug(f"[Load] DataFrame dtypes before cleaning:\n{df.dtypes}")
+        engine = get_engine(self.db_url)
 
-        # --- 3) Drop helper columns not in DB schema ---
-        if "installment_imputed" in df.columns:
-            logger.info(
-                "[Load] Dropping helper column 'installment_imputed' before insert"
+        # --- 2) Insert into database: COPY first, INSERT as fallback ---
+        # The audit JSON is only moved into place once the transaction commits.
+        if inserted_path is not None:
+            ensure_dirs(inserted_path)
+            part_path = f"{inserted_path}.part"
+
+        def _audit():
+            if inserted_path is None:
+                return nullcontext()
+            return _JsonArrayWriter(part_path)
+
+        dropped_indexes: list[str] | None = [] if drop_indexes else None
+
+        try:
+            with _audit() as audit:
+                n_rows = self._copy_chunks(
+                    engine,
+                    self._iter_chunks(transformed_data),
+                    table_name,
+                    audit,
+                    dropped_indexes,
+                )
+        except (SQLAlchemyError, engine.dialect.loaded_dbapi.Error) as e:
+            # Database errors only: a bad input file should fail, not retry
+            logger.warning(
+                f"[Load] COPY into '{table_name}' failed: {e}. "
+                "Falling back to INSERT."
             )
-            df_for_db = df.drop(columns=["installment_imputed"])
-        else:
-            df_for_db = df
+            with _audit() as audit:
+                n_rows = self._insert_chunks(
+                    engine, self._iter_chunks(transformed_data), table_name, audit
+                )
+
+        # --- 3) Publish inserted records JSON ---
+        if inserted_path is not None:
+            os.replace(part_path, inserted_path)
 
-        # --- 4) Convert each row to a normalized Python dict ---
-        records: list[dict] = []
-        for idx, (_, row) in enumerate(df_for_db.iterrows()):
-            raw = row.to_dict()
-            rec = self._normalize_record(raw)
-            records.append(rec)
+        # --- 4) Rebuild indexes dropped for the bulk load ---
+        if dropped_indexes:
+            self._recreate_indexes(engine, dropped_indexes)
 
-            # Optional: debug log for first few rows
-            if idx < 3:
-                logger.debug(f"[Load] Sample normalized row {idx}: {rec}")
+        if n_rows == 0:
+            logger.info("[Load] No data to insert. Skipped DB insert.")
+            return
 
         logger.info(
-            f"[Load] Prepared {len(records)} normalized rows "
-            f"to insert into '{table_name}'"
+            f"[Load] Inserted {n_rows} rows into '{table_name}'. "
+            + (f"JSON saved to: {inserted_path}" if inserted_path else "No JSON audit.")
         )
 
+
+class _JsonArrayWriter:
+    """
+    Write a JSON array incrementally, one batch of records at a time, so the
+    audit file never needs the full list of inserted rows in memory. The file
+    is removed if the block exits with an error.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._f = None
+        self._first = True
+
+    def __enter__(self) -> Self:
+        self._f = open(self.path, "wb")
+        self._f.write(b"[")
+        return self
+
+    def write(self, records: list[dict]) -> None:
         if not records:
-            logger.info("[Load] No records after conversion. Skipping DB insert.")
-            _ensure_dir(inserted_path)
-            with open(inserted_path, "w", encoding="utf-8") as f:
-                json.dump([], f, ensure_ascii=False, indent=2)
             return
+        # orjson emits UTF-8 bytes directly, one record per line
+        self._f.write(b"\n" if self._first else b",\n")
+        self._f.write(
+            b",\n".join(
+                orjson.dumps(rec, option=orjson.OPT_SERIALIZE_NUMPY) for rec in records
+            )
+        )
+        self._first = False
 
-        # --- 5) Insert into database using SQLAlchemy ---
-        engine = create_engine(self.db_url)
-        metadata = MetaData()
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            # Failed load: drop the partial file
+            self._f.close()
+            os.remove(self.path)
+            return
+        self._f.write(b"]" if self._first else b"\n]")
+        self._f.close()
 
-        try:
-            # Use transaction context – auto commit/rollback
-            with engine.begin() as conn:
-                # Reflect database schema
-                metadata.reflect(bind=conn)
 
-                table: Table | None = metadata.tables.get(table_name)
-                if table is None:
-                    raise RuntimeError(
-                        f"[Load] Table '{table_name}' not found in database."
-                    )
+class StringIteratorIO(io.TextIOBase):
+    """
+    Read-only text stream over an iterator of strings.
 
-                try:
-                    conn.execute(table.insert(), records)
-                except SQLAlchemyError as e:
-                    logger.error(
-                        f"[Load] Error while inserting into '{table_name}': {e}"
-                    )
-                    raise RuntimeError(
-                        f"Error while inserting into '{table_name}': {e}"
-                    ) from e
+    Lets COPY pull CSV lines as they are produced instead of requiring the
+    whole payload in a single in-memory buffer.
+    """
 
-            # --- 6) Save inserted records to JSON ---
-            _ensure_dir(inserted_path)
-            with open(inserted_path, "w", encoding="utf-8") as f:
-                json.dump(records, f, ensure_ascii=False, indent=2)
+    def __init__(self, iterable):
+        self._iter = iter(iterable)
+        self._buff = ""
+
+    def readable(self) -> bool:
+        return True
+
+    def _read1(self, n: int | None = None) -> str:
+        while not self._buff:
+            try:
+                self._buff = next(self._iter)
+            except StopIteration:
+                break
+        ret = self._buff[:n]
+        self._buff = self._buff[len(ret) :]
+        return ret
+
+    def read(self, n: int | None = -1) -> str:
+        chunks = []
+        if n is None or n < 0:
+            while True:
+                m = self._read1()
+                if not m:
+                    break
+                chunks.append(m)
+        else:
+            while n > 0:
+                m = self._read1(n)
+                if not m:
+                    break
+                n -= len(m)
+                chunks.append(m)
+        return "".join(chunks)
 
-            logger.info(
-                f"[Load] Inserted {len(records)} rows into '{table_name}'. "
-                f"JSON saved to: {inserted_path}"
-            )
 
-        finally:
-            engine.dispose()
+def _csv_value(value) -> str:
+    """
+    Format one normalized value as a COPY CSV field (None / <NA> / NaN →
+    NULL marker).
+    """
+    if value is None or value is pd.NA:
+        return _COPY_NULL
+    if isinstance(value, str):
+        return '"' + value.replace('"', '""') + '"'
+    if isinstance(value, float) and math.isnan(value):
+        return _COPY_NULL
+    return str(value)
+
+
+def _db_values(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Object-dtype copy of a normalized chunk with every missing value as None,
+    for DBAPI parameter binding (INSERT fallback only).
+    """
+    return df.astype(object).where(df.notna(), None)
 
 
-def _ensure_dir(path: str) -> None:
+def _csv_lines(df: pd.DataFrame):
     """
-    Ensure directory exists for given file path.
+    Yield CSV lines for COPY lazily, one normalized row at a time.
     """
-    dir_name = os.path.dirname(path)
-    if dir_name:
-        os.makedirs(dir_name, exist_ok=True)
+    for row in df.itertuples(index=False, name=None):
+        yield ",".join(map(_csv_value, row)) + "\n"
+
+
+def _iter_parquet(path: str) -> Iterator[pd.DataFrame]:
+    """
+    Read the DB_DTYPES columns of a Parquet file in CHUNK_SIZE-row frames.
+
+    Numeric columns keep their stored types; text and category columns are
+    returned as object.
+    """
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(path)
+    columns = [c for c in parquet_file.schema_arrow.names if c in DB_DTYPES]
+    for batch in parquet_file.iter_batches(batch_size=CHUNK_SIZE, columns=columns):
+        df = batch.to_pandas()
+        yield df.astype({c: "object" for c in columns if not is_numeric_dtype(df[c])})
 
 
 def load_data(
     transformed_data: Union[str, pd.DataFrame],
-    inserted_path: str,
-    table_name: str,
+    inserted_path: str | None = None,
+    table_name: str = "scrape_data",
     db_url: str | None = None,
+    drop_indexes: bool = False,
 ) -> None:
     """
     Convenience function to load data into DB using DBLoader.
@@ -239,16 +754,19 @@ def load_data(
     ----------
     transformed_data : str | pd.DataFrame
         CSV path or DataFrame to insert
-    inserted_path : str
-        JSON path to save inserted records
+    inserted_path : str | None
+        JSON path to save inserted records; None skips the audit file
     table_name : str
-        Target table name
+        Target table name, default "scrape_data"
     db_url : str | None
         Optional database URL
+    drop_indexes : bool
+        Drop and rebuild secondary indexes around large loads (see DBLoader.load)
     """
     loader = DBLoader(db_url=db_url)
     loader.load(
         transformed_data=transformed_data,
         inserted_path=inserted_path,
         table_name=table_name,
+        drop_indexes=drop_indexes,
     )
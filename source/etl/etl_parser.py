@@ -1,20 +1,55 @@
 # source/etl/etl_parser.py
 
+import csv
 import os
 import re
+from collections import Counter
 from datetime import date, timedelta
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import Optional
 
-import pandas as pd
-from bs4 import BeautifulSoup, NavigableString
 from loguru import logger
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 
+from source.etl.utils.etl_paths import ensure_dirs
 from source.etl.utils.etl_selector import ITEM, BASE_URL
 
 MISSING_VALUE = "data not found"
 
-
-def _convert_to_date(raw_text: str) -> str:
+# Parsed CSV schema, expected by ETLTransformer.transform()
+PARSED_COLUMNS = (
+    "title",
+    "price",
+    "listing_url",
+    "location",
+    "posted_time",
+    "installment",
+    "year_mileage",
+)
+
+# Precompiled: used once per listing
+_REL_DAYS_RE = re.compile(r"(\d+)\s+hari yang lalu")
+
+# Indonesian month abbreviations, indexed by month number (1-12)
+_MONTH_MAP = (
+    None,
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "Mei",
+    "Jun",
+    "Jul",
+    "Agu",
+    "Sep",
+    "Okt",
+    "Nov",
+    "Des",
+)
+
+
+@lru_cache(maxsize=256)
+def _convert_to_date(raw_text: str, today: date) -> str:
     """
     Convert relative Indonesian date text into a normalized date string.
 
@@ -23,27 +58,14 @@ def _convert_to_date(raw_text: str) -> str:
       - "kemarin" -> yesterday (DD Mon)
       - "N hari yang lalu" -> N days ago (DD Mon)
     Returns raw_text if pattern is not recognized.
+
+    `today` is the reference date, computed once per parse_html() call.
+    Results are memoized: a page repeats the same few posted-time strings.
     """
     if not raw_text:
         return raw_text
 
     lower = raw_text.lower()
-    MONTH_MAP = {
-        1: "Jan",
-        2: "Feb",
-        3: "Mar",
-        4: "Apr",
-        5: "Mei",
-        6: "Jun",
-        7: "Jul",
-        8: "Agu",
-        9: "Sep",
-        10: "Okt",
-        11: "Nov",
-        12: "Des",
-    }
-
-    today = date.today()
 
     # Handle relative date patterns
     if "hari ini" in lower:
@@ -51,7 +73,7 @@ def _convert_to_date(raw_text: str) -> str:
     elif "kemarin" in lower:
         target_date = today - timedelta(days=1)
     else:
-        match = re.search(r"(\d+)\s+hari yang lalu", lower)
+        match = _REL_DAYS_RE.search(lower)
         if match:
             n = int(match.group(1))
             target_date = today - timedelta(days=n)
@@ -59,7 +81,130 @@ def _convert_to_date(raw_text: str) -> str:
             # Not a relative pattern: return as-is (e.g. '18 Nov')
             return raw_text
 
-    return f"{target_date.day} {MONTH_MAP[target_date.month]}"
+    return f"{target_date.day} {_MONTH_MAP[target_date.month]}"
+
+
+def _text(node: LexborNode, separator: str = "") -> str:
+    """
+    Text of a node like BeautifulSoup's get_text(separator, strip=True):
+    every text node stripped, empty ones dropped, the rest joined.
+    """
+    parts = (
+        n.text_content.strip()
+        for n in node.traverse(include_text=True)
+        if n.is_text_node
+    )
+    return separator.join(p for p in parts if p)
+
+
+def _find(node: LexborNode, selector: str) -> Optional[LexborNode]:
+    """
+    First descendant matching selector. Lexbor's css_first() may return the
+    node itself, BeautifulSoup's find() only looks below it.
+    """
+    for match in node.css(selector):
+        if match.mem_id != node.mem_id:
+            return match
+    return None
+
+
+def _next_element(node: LexborNode) -> Optional[LexborNode]:
+    """
+    Next sibling that is an element (skips text and comment nodes).
+    """
+    sibling = node.next
+    while sibling is not None and not sibling.is_element_node:
+        sibling = sibling.next
+    return sibling
+
+
+def _parse_listing(item: LexborNode, today: date) -> tuple[str, ...]:
+    """
+    Extract one listing's fields, in PARSED_COLUMNS order.
+    """
+    # One pass over the listing: first element per data-aut-id value
+    tags: dict[str, LexborNode] = {}
+    for tag in item.css("[data-aut-id]"):
+        tags.setdefault(tag.attributes.get("data-aut-id"), tag)
+
+    # a) --- Extract title ---
+    title_tag = tags.get("itemTitle")
+    title = _text(title_tag) if title_tag else MISSING_VALUE
+
+    # b) --- Extract price ---
+    price_tag = tags.get("itemPrice")
+    price = _text(price_tag) if price_tag else MISSING_VALUE
+
+    # c) --- Extract listing URL --- (path + domain)
+    url_tag = _find(item, "a[href]")
+    # selectolax gives None for a valueless href (<a href>)
+    href = url_tag.attributes["href"] if url_tag else None
+    listing_url = f"{BASE_URL}{href}" if href else MISSING_VALUE
+
+    # d) --- Extract location and posted_time ---
+    location = MISSING_VALUE
+    posted_time = MISSING_VALUE
+
+    # --- Pattern A (new layout) ---
+    # Example HTML:
+    # <span data-aut-id="item-location">Jetis, Yogyakarta Kota</span>
+    # <span><span>18 Nov</span></span>
+    loc_tag = tags.get("item-location")
+    if loc_tag:
+        # Extract location text
+        loc_text = _text(loc_tag)
+        location = loc_text if loc_text else MISSING_VALUE
+
+        # Posted date is usually in the next sibling <span>
+        sibling = _next_element(loc_tag)
+        if sibling:
+            inner_span = _find(sibling, "span") or sibling
+            if inner_span:
+                raw_time = _text(inner_span)
+                posted_time = _convert_to_date(raw_time, today)
+    else:
+        # --- Pattern B (old layout) ---
+        # Example HTML:
+        # <div data-aut-id="itemDetails">Kuta Alam<span>Hari ini</span></div>
+        details_tag = tags.get("itemDetails")
+        if details_tag and details_tag.child is not None:
+            # Extract location from the first content node
+            first = details_tag.child
+            if first.is_text_node:
+                loc_text = first.text_content.strip()
+                location = loc_text if loc_text else MISSING_VALUE
+            else:
+                # Fallback: take all text (e.g., "Kuta Alam Hari ini")
+                full_text = _text(details_tag, " ")
+                location = full_text if full_text else MISSING_VALUE
+
+            # Span inside contains time info: "Hari ini", "18 Nov", "4 hari yang lalu"
+            span_tag = _find(details_tag, "span")
+            if span_tag:
+                raw_time = _text(span_tag)
+                posted_time = _convert_to_date(raw_time, today)
+        else:
+            # No location or posted_time found, retain default MISSING_VALUE
+            location = MISSING_VALUE
+            posted_time = MISSING_VALUE
+
+    # --- Extract installment info ---
+    installment_tag = tags.get("itemInstallment")
+    installment = _text(installment_tag) if installment_tag else MISSING_VALUE
+
+    # --- Extract year and mileage ---
+    ym_tag = tags.get("itemSubTitle")
+    year_mileage = _text(ym_tag, " ") if ym_tag else MISSING_VALUE
+
+    return (
+        title,
+        price,
+        listing_url,
+        location,
+        posted_time,
+        installment,
+        year_mileage,
+    )
 
 
 def parse_html(html_data: str, parsed_path: str) -> None:
@@ -88,118 +233,40 @@ def parse_html(html_data: str, parsed_path: str) -> None:
 
     logger.info(f"[Parse] Start parsing HTML -> {parsed_path}")
 
-    # --- 1) Parse HTML with BeautifulSoup ---
-    soup = BeautifulSoup(html_data, "html.parser")
+    # --- 1) Parse HTML with selectolax (lexbor backend) ---
+    tree = LexborHTMLParser(html_data)
 
     # Select all listing elements using CSS selector
-    listings = soup.select(ITEM)  # ITEM = selector 'li[data-aut-id="itemBox"]', etc.
+    listings = tree.css(ITEM)  # ITEM = selector 'li[data-aut-id="itemBox"]', etc.
     logger.info(f"[Parse] Found {len(listings)} listing elements with selector ITEM")
 
-    # List to hold parsed dictionary for each listing
-    parsed: List[Dict[str, Optional[str]]] = []
-
-    # --- 2) 2: Loop through each listing ---
-    for idx, item in enumerate(listings):
-        # a) --- Extract title ---
-        title_tag = item.find(attrs={"data-aut-id": "itemTitle"})
-        title = title_tag.get_text(strip=True) if title_tag else MISSING_VALUE
-        if not title_tag:
-            logger.debug(f"[Parse] Listing #{idx}: missing title")
-
-        # b) --- Extract price ---
-        price_tag = item.find(attrs={"data-aut-id": "itemPrice"})
-        price = price_tag.get_text(strip=True) if price_tag else MISSING_VALUE
-        if not price_tag:
-            logger.debug(f"[Parse] Listing #{idx}: missing price")
-
-        # c) --- Extract listing URL --- (path + domain)
-        url_tag = item.find("a", href=True)
-        if url_tag:
-            href = url_tag["href"]
-            listing_url = f"{BASE_URL}{href}"
-        else:
-            listing_url = MISSING_VALUE
-            logger.debug(f"[Parse] Listing #{idx}: missing URL <a href>")
-
-        # d) --- Extract location and posted_time ---
-        location = MISSING_VALUE
-        posted_time = MISSING_VALUE
-
-        # --- Pattern A (new layout) ---
-        # Example HTML:
-        # <span data-aut-id="item-location">Jetis, Yogyakarta Kota</span>
-        # <span><span>18 Nov</span></span>
-        loc_tag = item.find(attrs={"data-aut-id": "item-location"})
-        if loc_tag:
-            # Extract location text
-            loc_text = loc_tag.get_text(strip=True)
-            location = loc_text if loc_text else MISSING_VALUE
-
-            # Posted date is usually in the next sibling <span>
-            sibling = loc_tag.find_next_sibling()
-            if sibling:
-                inner_span = sibling.find("span") or sibling
-                if inner_span:
-                    raw_time = inner_span.get_text(strip=True)
-                    posted_time = _convert_to_date(raw_time)
-        else:
-            # --- Pattern B (old layout) ---
-            # Example HTML:
-            # <div data-aut-id="itemDetails">Kuta Alam<span>Hari ini</span></div>
-            details_tag = item.find(attrs={"data-aut-id": "itemDetails"})
-            if details_tag and details_tag.contents:
-                # Extract location from the first content node
-                first = details_tag.contents[0]
-                if isinstance(first, NavigableString):
-                    loc_text = first.strip()
-                    location = loc_text if loc_text else MISSING_VALUE
-                else:
-                    # Fallback: take all text (e.g., "Kuta Alam Hari ini")
-                    full_text = details_tag.get_text(" ", strip=True)
-                    location = full_text if full_text else MISSING_VALUE
-
-                # Span inside contains time info: "Hari ini", "18 Nov", "4 hari yang lalu"
-                span_tag = details_tag.find("span")
-                if span_tag:
-                    raw_time = span_tag.get_text(strip=True)
-                    posted_time = _convert_to_date(raw_time)
-            else:
-                # No location or posted_time found, retain default MISSING_VALUE
-                location = MISSING_VALUE
-                posted_time = MISSING_VALUE
-
-        # --- Extract installment info ---
-        installment_tag = item.find(attrs={"data-aut-id": "itemInstallment"})
-        installment = (
-            installment_tag.get_text(strip=True) if installment_tag else MISSING_VALUE
-        )
+    # Reference date for relative posted times ("kemarin", "3 hari yang lalu")
+    today = date.today()
 
-        # --- Extract year and mileage ---
-        ym_tag = item.find(attrs={"data-aut-id": "itemSubTitle"})
-        year_mileage = ym_tag.get_text(" ", strip=True) if ym_tag else MISSING_VALUE
-
-        # --- Add parsed data to the list ---
-        parsed.append(
-            {
-                "title": title,
-                "price": price,
-                "listing_url": listing_url,
-                "location": location,
-                "posted_time": posted_time,
-                "installment": installment,
-                "year_mileage": year_mileage,
-            }
+    # --- 2) Write one CSV row per listing as it is parsed ---
+    # Rows go to a .part file that replaces parsed_path only once complete,
+    # so a failed parse never leaves a truncated CSV behind
+    part_path = f"{parsed_path}.part"
+    # Per-column count of listings without the field, logged once at the end
+    n_missing: Counter = Counter()
+    ensure_dirs(parsed_path)
+
+    with open(part_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(PARSED_COLUMNS)
+        for item in listings:
+            row = _parse_listing(item, today)
+            writer.writerow(row)
+            for column, value in zip(PARSED_COLUMNS, row):
+                if value == MISSING_VALUE:
+                    n_missing[column] += 1
+
+    os.replace(part_path, parsed_path)
+
+    if n_missing:
+        summary = ", ".join(
+            f"{col}={n_missing[col]}" for col in PARSED_COLUMNS if n_missing[col]
         )
+        logger.debug(f"[Parse] Listings with missing fields: {summary}")
 
-    # --- 3) Convert parsed list into DataFrame ---
-    df = pd.DataFrame(parsed)
-
-    # --- 4) Ensure the destination folder exists ---
-    dir_name = os.path.dirname(parsed_path)
-    if dir_name:
-        os.makedirs(dir_name, exist_ok=True)
-
-    # --- 5) Save DataFrame to CSV ---
-    df.to_csv(parsed_path, index=False, encoding="utf-8")
-
-    logger.info(f"[Parse] Parsing done. {len(df)} rows written to: {parsed_path}")
+    logger.info(f"[Parse] Parsing done. {len(listings)} rows written to: {parsed_path}")
@@ -1,10 +1,16 @@
 # source/etl/etl_scraper.py
 
+import asyncio
+import hashlib
 import os
+import time
+
 from loguru import logger
+from playwright.async_api import Browser, async_playwright
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from tqdm.std import tqdm as std_tqdm
 
+from source.etl.utils.etl_paths import ensure_dirs
 from source.etl.utils.etl_selector import (
     LOCATION_INPUT,
     LOCATION,
@@ -13,36 +19,178 @@ from source.etl.utils.etl_selector import (
     LOAD_MORE_BUTTON,
 )
 
+# Scraped HTML younger than this is reused instead of re-scraped (0 disables)
+HTML_CACHE_TTL_SECONDS = int(os.getenv("HTML_CACHE_TTL_SECONDS", "21600"))  # 6 hours
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/117.0.0.0 Safari/537.36"
+)
+
+# Resource types aborted by the scraper: never needed to read the listing HTML.
+# Stylesheets stay loaded because popups, the location dropdown and the
+# "Load more" button rely on CSS visibility for Playwright's clicks.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+# Fixed page size, so layout (and how many items a scroll reveals) is the
+# same on every run
+VIEWPORT = {"width": 1280, "height": 720}
+
+# Injected before any page script: no CSS animations/transitions, so new
+# listings and popups are clickable as soon as they are in the DOM
+_NO_ANIMATIONS_JS = """
+document.addEventListener("DOMContentLoaded", () => {
+  const style = document.createElement("style");
+  style.textContent =
+    "*, *::before, *::after { animation: none !important; " +
+    "transition: none !important; scroll-behavior: auto !important; }";
+  document.head.appendChild(style);
+});
+"""
+
+# Infinite scroll: each count is one evaluate() round-trip; after a click or
+# scroll, wait in the page until the count grows (or SCROLL_WAIT_MS passes)
+SCROLL_WAIT_MS = 1500
+_COUNT_ITEMS_JS = "selector => document.querySelectorAll(selector).length"
+_MORE_ITEMS_JS = (
+    "([selector, previous]) => " "document.querySelectorAll(selector).length > previous"
+)
+
+
+def _cache_key(keyword: str, location: str) -> str:
+    """
+    Identify one search (keyword + location) for the HTML cache.
+    """
+    return hashlib.sha1(f"{keyword}|{location}".encode()).hexdigest()
+
+
+def is_html_fresh(
+    html_path: str,
+    keyword: str,
+    location: str = "Indonesia",
+    ttl_seconds: int = HTML_CACHE_TTL_SECONDS,
+) -> bool:
+    """
+    Check whether html_path holds a cached scrape that can be reused.
+
+    The file must be younger than ttl_seconds and its sidecar key
+    (<html_path>.sha1, written by olx_scraper) must match keyword + location,
+    so a page scraped for another search is never treated as a hit.
+    """
+    if ttl_seconds <= 0:
+        return False
+
+    try:
+        age = time.time() - os.path.getmtime(html_path)
+        with open(f"{html_path}.sha1", "r", encoding="utf-8") as f:
+            key = f.read().strip()
+    except OSError:
+        return False
+
+    return age < ttl_seconds and key == _cache_key(keyword, location)
+
+
+def _save_html(html_path: str, html_content: str, cache_key: str) -> None:
+    """
+    Write scraped HTML plus its <html_path>.sha1 sidecar key, so
+    is_html_fresh() can match the cached page to its search.
+    """
+    ensure_dirs(html_path)
+
+    with open(html_path, "w", encoding="utf-8") as f:
+        f.write(html_content)
+
+    with open(f"{html_path}.sha1", "w", encoding="utf-8") as f:
+        f.write(cache_key)
+
+
+class PlaywrightSession:
+    """
+    Async context manager that owns one Playwright driver and one Chromium
+    browser, so several scrapes can share a single browser launch.
+
+    Example
+    -------
+        async with PlaywrightSession(headless=True) as browser:
+            await olx_scraper(browser, "Toyota Calya", "data/raw_html/calya.html")
+            await olx_scraper(browser, "Honda Jazz", "data/raw_html/jazz.html")
+    """
+
+    def __init__(self, headless: bool = True):
+        self.headless = headless
+        self._playwright = None
+        self._browser: Browser | None = None
+
+    async def __aenter__(self) -> Browser:
+        self._playwright = await async_playwright().start()
+        try:
+            self._browser = await self._playwright.chromium.launch(
+                headless=self.headless
+            )
+        except Exception:
+            await self._playwright.stop()
+            raise
+        logger.info(f"[Scraper] Browser launched (headless={self.headless})")
+        return self._browser
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        try:
+            await self._browser.close()
+            logger.info("[Scraper] Browser closed")
+        finally:
+            await self._playwright.stop()
+
+
+async def _block_heavy_assets(route) -> None:
+    """
+    Route handler: abort images, fonts and media, let everything else through.
+    """
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
 
 async def olx_scraper(
-    playwright,
+    browser: Browser,
     keyword: str,
     html_path: str,
     location: str = "Indonesia",
-    headless: bool = False,  # default tetap False biar enak debugging
     goto_timeout_ms: int = 60000,
+    block_assets: bool = True,
+    capture_screenshot: bool = False,
 ) -> None:
     """
     Asynchronous web scraper for fetching used car listings.
 
     Extracts HTML content from a target marketplace, handles pop-ups, sets
-    location, performs infinite scrolling to load all items, captures a
-    screenshot, and saves HTML locally.
+    location, performs infinite scrolling to load all items, optionally
+    captures a screenshot, and saves HTML locally.
+
+    Each call opens its own browser context (cookies, location choice) on the
+    shared browser and closes it when done; the browser itself is owned by the
+    caller, typically via PlaywrightSession. By default images, fonts and media
+    are not downloaded (see BLOCKED_RESOURCE_TYPES). Pages use a fixed
+    VIEWPORT and have CSS animations and transitions disabled.
 
     Parameters
     ----------
-    playwright : Playwright object
-        The Playwright instance for browser automation.
+    browser : playwright.async_api.Browser
+        Launched browser to scrape with (see PlaywrightSession).
     keyword : str
         Search keyword to find relevant car listings.
     html_path : str
         Path where the scraped HTML will be saved.
     location : str, optional
         Geographic location filter, default is 'Indonesia'.
-    headless : bool, optional
-        Whether to run browser in headless mode, default is False.
     goto_timeout_ms : int, optional
         Timeout for page.goto() in milliseconds, default is 60000.
+    block_assets : bool, optional
+        Abort requests for BLOCKED_RESOURCE_TYPES, default True.
+    capture_screenshot : bool, optional
+        Save a full-page screenshot to screenshots/<keyword>.png, default
+        False (it re-renders the whole page).
     """
 
     # --- 1) Build search URL from keyword ---
@@ -54,15 +202,12 @@ async def olx_scraper(
         f"[Scraper] Start OLX scrape for keyword='{keyword}', url='{url}', location='{location}'"
     )
 
-    # --- 2) Launch browser and page
-    browser = await playwright.chromium.launch(headless=headless)
-    page = await browser.new_page(
-        user_agent=(
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/117.0.0.0 Safari/537.36"
-        )
-    )
+    # --- 2) Open an isolated context and page on the shared browser
+    context = await browser.new_context(user_agent=USER_AGENT, viewport=VIEWPORT)
+    await context.add_init_script(_NO_ANIMATIONS_JS)
+    if block_assets:
+        await context.route("**/*", _block_heavy_assets)
+    page = await context.new_page()
 
     try:
         # --- 3) Navigate to target page ---
@@ -113,7 +258,7 @@ async def olx_scraper(
         ) as pbar:
             while True:
                 # Init Count how many listing items are currently loaded
-                current_listing = await page.locator(ITEM).count()
+                current_listing = await page.evaluate(_COUNT_ITEMS_JS, ITEM)
 
                 if current_listing > total_listing:
                     # If new items are found, update totals
@@ -134,14 +279,22 @@ async def olx_scraper(
                 try:
                     # Try to click "Load More" button to load more items
                     await page.click(LOAD_MORE_BUTTON, timeout=2000)
-                    await page.wait_for_timeout(1500)
 
                 except PlaywrightTimeoutError:
                     # If no button, scroll to bottom to trigger lazy loading
                     await page.evaluate(
                         "window.scrollTo(0, document.body.scrollHeight);"
                     )
-                    await page.wait_for_timeout(1500)
+
+                try:
+                    # Return as soon as new items render instead of a fixed sleep
+                    await page.wait_for_function(
+                        _MORE_ITEMS_JS,
+                        arg=[ITEM, total_listing],
+                        timeout=SCROLL_WAIT_MS,
+                    )
+                except PlaywrightTimeoutError:
+                    pass
 
                 # Exit loop after several rounds without new items
                 if no_new_round >= max_no_new_round:
@@ -151,22 +304,19 @@ async def olx_scraper(
                     )
                     break
 
-        # --- 7) Save a full-page screenshot ---
-        screenshot_name = f"{keyword.replace(' ', '_')}.png"
-        screenshot_path = os.path.join("screenshots", screenshot_name)
-        os.makedirs("screenshots", exist_ok=True)
-        await page.screenshot(path=screenshot_path, full_page=True)
-        logger.info(f"[Scraper] Screenshot saved to {screenshot_path}")
+        # --- 7) Optionally save a full-page screenshot ---
+        if capture_screenshot:
+            screenshot_name = f"{keyword.replace(' ', '_')}.png"
+            screenshot_path = os.path.join("screenshots", screenshot_name)
+            ensure_dirs(screenshot_path)
+            await page.screenshot(path=screenshot_path, full_page=True)
+            logger.info(f"[Scraper] Screenshot saved to {screenshot_path}")
 
-        # --- 8) Save HTML ---
+        # --- 8) Save HTML (file I/O off the event loop) ---
         html_content = await page.content()
-
-        html_dir = os.path.dirname(html_path)
-        if html_dir:
-            os.makedirs(html_dir, exist_ok=True)
-
-        with open(html_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        await asyncio.to_thread(
+            _save_html, html_path, html_content, _cache_key(keyword, location)
+        )
 
         logger.info(
             f"[Scraper] HTML saved to {html_path} (total items ~ {total_listing})"
@@ -178,6 +328,67 @@ async def olx_scraper(
         raise
 
     finally:
-        # --- 9) Close browser ---
-        await browser.close()
-        logger.info("[Scraper] Browser closed")
+        # --- 9) Close browser context (browser stays open for reuse) ---
+        await context.close()
+        logger.debug(f"[Scraper] Browser context closed for '{keyword}'")
+
+
+async def olx_scraper_many(
+    browser: Browser,
+    html_paths: dict[str, str],
+    location: str = "Indonesia",
+    max_concurrency: int = 5,
+    goto_timeout_ms: int = 60000,
+    block_assets: bool = True,
+    capture_screenshot: bool = False,
+) -> None:
+    """
+    Scrape several keywords concurrently on one shared browser.
+
+    Each keyword runs olx_scraper in its own browser context; at most
+    max_concurrency pages are open at a time. Every scrape is allowed to
+    finish, then the first failure (if any) is raised, so pages that did
+    succeed are saved and reused by the HTML cache on a retry.
+
+    Parameters
+    ----------
+    browser : playwright.async_api.Browser
+        Launched browser to scrape with (see PlaywrightSession).
+    html_paths : dict[str, str]
+        Mapping of search keyword -> path where its HTML will be saved.
+    location : str, optional
+        Geographic location filter, default is 'Indonesia'.
+    max_concurrency : int, optional
+        Maximum number of keywords scraped at the same time, default 5.
+    goto_timeout_ms : int, optional
+        Timeout for page.goto() in milliseconds, default is 60000.
+    block_assets, capture_screenshot : bool, optional
+        Passed to olx_scraper.
+    """
+    slots = asyncio.Semaphore(max_concurrency)
+
+    async def _scrape_one(keyword: str, html_path: str) -> None:
+        async with slots:
+            await olx_scraper(
+                browser,
+                keyword,
+                html_path,
+                location=location,
+                goto_timeout_ms=goto_timeout_ms,
+                block_assets=block_assets,
+                capture_screenshot=capture_screenshot,
+            )
+
+    logger.info(
+        f"[Scraper] Scraping {len(html_paths)} keywords "
+        f"(max_concurrency={max_concurrency})"
+    )
+    results = await asyncio.gather(
+        *(_scrape_one(kw, path) for kw, path in html_paths.items()),
+        return_exceptions=True,
+    )
+
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if errors:
+        logger.error(f"[Scraper] {len(errors)}/{len(html_paths)} scrapes failed")
+        raise errors[0]
@@ -1,15 +1,70 @@
 # source/etl/etl_transformer.py
 
+from __future__ import annotations
+
+import csv
+import math
 import os
 import re
+from typing import Any
 
 import pandas as pd
 from loguru import logger
 
+from source.etl.utils.etl_paths import ensure_dirs
 from source.etl.utils.etl_selector import BASE_URL
 
+try:
+    # Optional: multi-threaded C++ CSV reader/writer and Parquet output
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pragma: no cover - falls back to pandas' reader/writer
+    pa = None
+
 MISSING_VALUE = "data not found"
 
+# Rows per write batch when pandas' CSV writer is used
+CSV_CHUNK_SIZE = 50_000
+
+# Tokens read as missing from the parsed CSV: pyarrow's defaults plus the two
+# extra ones pandas.read_csv also recognizes
+_CSV_NULL_VALUES = [
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+]
+
+# Upper bound for the nullable Int32 year column
+_INT32_MAX = 2**31 - 1
+
+# Precompiled patterns for the column cleaners; the character classes match
+# whole runs so each value needs as few substitutions as possible
+_DIGITS_RE = re.compile(r"\D+")
+_YEAR_KM_RE = re.compile(
+    r"^\D*(?P<year>\d[\d\.]*)"
+    r"(?:\D+(?P<lower_km>\d[\d\.]*))?"
+    r"(?:\D+(?P<upper_km>\d[\d\.]*))?"
+)
+_LOC_SPLIT_RE = re.compile(r"\.| \| | - ")
+_INSTALLMENT_RE = re.compile(r"[^0-9,\.]+")
+_COMMA_DECIMAL_TABLE = str.maketrans({".": None, ",": "."})
+
 
 class ETLTransformer:
     """
@@ -26,8 +81,154 @@ class ETLTransformer:
         self.base_url = base_url
         self.missing_value = missing_value
 
-    # --- Helper functions for individual transformations ---
-    def _cleanPrice(self, val: str | float) -> float | pd.NA:
+    # --- Column-wise (vectorized) transformations ---
+    def _asText(self, col: pd.Series) -> pd.Series:
+        """
+        Column as pandas string dtype with NaN and missing_value set to <NA>.
+        """
+        s = col.astype("string")
+        return s.mask(s == self.missing_value)
+
+    def _cleanPriceColumn(self, col: pd.Series) -> pd.Series:
+        """
+        Normalize a price column like 'Rp 450.000.000' -> 450000000.0.
+        Values without any digit become NaN.
+        """
+        digits = col.astype("string").str.replace(_DIGITS_RE, "", regex=True)
+        out = pd.to_numeric(digits.mask(digits == ""), errors="coerce")
+        out = out.astype("float64")
+
+        n_failed = int((out.isna() & col.notna()).sum())
+        if n_failed:
+            logger.debug(f"[_cleanPrice] {n_failed} values could not be converted")
+        return out
+
+    def _cleanInstallmentsColumn(self, col: pd.Series) -> pd.Series:
+        """
+        Normalize an installment column to float values in IDR.
+
+        Handles:
+        - 'Rp 8,9 jt/bulan' -> 8.9e6
+        - '8.900.000' -> 8.9e6
+        """
+        # Keep digits and separators only (letters go too, so no lower())
+        s = self._asText(col).str.replace(_INSTALLMENT_RE, "", regex=True)
+
+        # A comma is the decimal separator: any "." is then a thousands
+        # separator. One translate pass drops the dots and turns "," into "."
+        has_comma = s.str.contains(",", regex=False).fillna(False)
+        if has_comma.any():
+            s = s.mask(has_comma, s.str.translate(_COMMA_DECIMAL_TABLE))
+
+        base = pd.to_numeric(s.mask(s == ""), errors="coerce").astype("float64")
+
+        n_failed = int((base.isna() & s.notna()).sum())
+        if n_failed:
+            logger.debug(
+                f"[_cleanInstallments] {n_failed} values could not be converted"
+            )
+        return base * 1_000_000
+
+    def _parseYearMileageColumn(self, col: pd.Series) -> pd.DataFrame:
+        """
+        Parse a column like "2018 • 70.000-75.000 km" into a DataFrame with
+        year (nullable Int32), lower_km and upper_km (float64, NaN if missing).
+
+        The first number is the year, the next one or two are the mileage
+        range; a single mileage fills both bounds.
+        """
+        ext = self._asText(col).str.extract(_YEAR_KM_RE)
+
+        # "2018.5"-style tokens are not a valid year
+        has_dot = ext["year"].str.contains(".", regex=False).fillna(False)
+        year_tok = ext["year"].mask(has_dot)
+        out = pd.DataFrame(index=col.index)
+        year = pd.to_numeric(year_tok, errors="coerce")
+        # Tokens too large for Int32 are not a year either
+        out["year"] = year.where(year <= _INT32_MAX).astype("Int32")
+        for name in ("lower_km", "upper_km"):
+            km = ext[name].str.replace(".", "", regex=False)
+            out[name] = pd.to_numeric(km, errors="coerce").astype("float64")
+        out["upper_km"] = out["upper_km"].fillna(out["lower_km"])
+
+        n_failed = int((ext["year"].isna() & col.notna()).sum())
+        if n_failed:
+            logger.debug(f"[_parseYearMileage] {n_failed} values without numbers")
+        return out
+
+    def _estimateInstallmentColumn(self, price: pd.Series) -> pd.Series:
+        """
+        Estimate monthly installments for a price column:
+        - 30% down payment, 11% other costs, 20% interest, 36 months tenor
+
+        Missing or non-positive prices give NaN.
+        """
+        price = pd.to_numeric(price, errors="coerce").astype("float64")
+        price = price.where(price > 0)
+
+        # Same step order as the original per-row formula, so the rounded
+        # result matches it to the cent
+        down_payment = 0.3 * price
+        other_costs = 0.11 * price
+        loan = (price - down_payment) + other_costs
+        interest = 0.20 * loan
+        tenor = 36
+
+        return ((loan + interest) / tenor).round(2)
+
+    def _enrichURLColumn(self, col: pd.Series) -> pd.Series:
+        """
+        Ensure URLs are absolute by prefixing base_url where needed.
+        """
+        s = self._asText(col).str.strip()
+        s = s.mask(s == "")
+        is_absolute = s.str.startswith(("http", "https")).fillna(False)
+        return s.where(is_absolute, self.base_url + s).astype(object)
+
+    def _cleanLocationColumn(self, col: pd.Series) -> pd.Series:
+        """
+        Simplify locations to their first segment (e.g. 'Jakarta' from
+        'Jakarta - Selatan').
+        """
+        s = self._asText(col).str.strip()
+        first = s.str.split(_LOC_SPLIT_RE, n=1, regex=True).str[0]
+        return first.str.strip().astype(object)
+
+    def _transformPostedTimeColumn(self, col: pd.Series) -> pd.Series:
+        """
+        Validate posted_time strings (max 7 chars).
+        """
+        s = self._asText(col).str.strip()
+        too_long = (s.str.len() > 7).fillna(False)
+        if too_long.any():
+            logger.debug(
+                f"[_transformPostedTime] {int(too_long.sum())} values out of range"
+            )
+        return s.mask(too_long).astype(object)
+
+    def _cleanCategorical(self, col: pd.Series, column_fn) -> pd.Series:
+        """
+        Apply a column cleaner once per distinct value of a low-cardinality
+        column (location, posted_time) and return the result as category
+        dtype. Missing values stay missing.
+        """
+        codes, uniques = pd.factorize(col, use_na_sentinel=True)
+        if len(uniques) == 0:
+            # All missing (e.g. an all-NaN column read back from CSV)
+            return pd.Series(None, index=col.index, dtype="category")
+        cleaned = column_fn(pd.Series(uniques, dtype=object))
+
+        values = cleaned.to_numpy(dtype=object)[codes]
+        values[codes == -1] = None
+        return pd.Series(values, index=col.index, dtype="category")
+
+    # --- Helper functions for individual values ---
+    # Single-value wrappers around the column versions above, so both always
+    # share one implementation.
+    def _applyToValue(self, column_fn, val):
+        return column_fn(pd.Series([val], dtype=object)).iloc[0]
+
+    def _cleanPrice(self, val: str | float) -> float:
         """
         Normalize price string like 'Rp 450.000.000' -> 450000000.0.
 
@@ -38,164 +239,119 @@ class ETLTransformer:
 
         Returns
         -------
-        float | pd.NA
+        float
+            NaN if no price can be extracted
         """
-        if pd.isna(val):
-            return pd.NA
-
-        s = re.sub(r"[^\d]", "", str(val))
-        if not s:
-            logger.debug(f"[_cleanPrice] Failed to convert value: {val!r}")
-            return pd.NA
-        try:
-            return float(s)
-        except ValueError:
-            logger.debug(f"[_cleanPrice] ValueError converting: {val!r}")
-            return pd.NA
+        return self._applyToValue(self._cleanPriceColumn, val)
 
-    def _parseYearMileage(self, val: str) -> pd.Series:
+    def _parseYearMileage(self, val: str) -> tuple[Any, Any, Any]:
         """
-        Parse string like "2018 • 70.000-75.000 km" into three numeric columns:
-        year, lower_km, upper_km.
-        """
-
-        year, lower_km, upper_km = pd.NA, pd.NA, pd.NA
-
-        if pd.isna(val) or val in ["-", self.missing_value]:
-            return pd.Series([year, lower_km, upper_km])
+        Parse string like "2018 • 70.000-75.000 km" into a plain
+        (year, lower_km, upper_km) tuple.
 
-        text = str(val)
-        nums = re.findall(r"\d[\d\.]*", text)  # extract all numbers
-
-        if not nums:
-            logger.debug(f"[_parseYearMileage] No numbers found in value: {val!r}")
-            return pd.Series([year, lower_km, upper_km])
-
-        # First number is year
-        try:
-            year = int(nums[0])
-        except ValueError:
-            logger.debug(f"[_parseYearMileage] Invalid year token: {nums[0]!r}")
-            year = pd.NA
-
-        # Remaining numbers are mileage
-        km_vals: list[float] = []
-        for num in nums[1:]:
-            num_clean = num.replace(".", "")
-            try:
-                km_vals.append(float(num_clean))
-            except ValueError:
-                logger.debug(f"[_parseYearMileage] Invalid km value: {num!r}")
-                continue
-
-        if len(km_vals) == 1:
-            lower_km = upper_km = km_vals[0]
-        elif len(km_vals) >= 2:
-            lower_km, upper_km = km_vals[:2]
-
-        return pd.Series([year, lower_km, upper_km])
+        Matches the scalar directly with the same rules as
+        _parseYearMileageColumn, without building a one-row frame.
+        """
+        if pd.isna(val) or val == self.missing_value:
+            return pd.NA, math.nan, math.nan
+        m = _YEAR_KM_RE.match(str(val))
+        if m is None:
+            return pd.NA, math.nan, math.nan
+
+        year_tok = m["year"]
+        year = pd.NA
+        if "." not in year_tok and int(year_tok) <= _INT32_MAX:
+            year = int(year_tok)
+        lower_km, upper_km = (
+            float(tok.replace(".", "")) if tok is not None else math.nan
+            for tok in (m["lower_km"], m["upper_km"])
+        )
+        if math.isnan(upper_km):
+            upper_km = lower_km
+        return year, lower_km, upper_km
 
     def _enrichURL(self, val: str) -> str | pd.NA:
         """
         Ensure URL is absolute by prefixing BASE_URL if needed.
         """
-        if pd.isna(val) or val == self.missing_value:
-            return pd.NA
-
-        s = str(val).strip()
-        if not s:
-            logger.debug(f"[_enrichURL] Empty URL value: {val!r}")
-            return pd.NA
-        if s.startswith(("http", "https")):
-            return s
-        return f"{self.base_url}{s}"
+        return self._applyToValue(self._enrichURLColumn, val)
 
     def _cleanLocation(self, val: str) -> str | pd.NA:
         """
         Simplify location to first segment (e.g., 'Jakarta' from 'Jakarta - Selatan').
         """
-        if pd.isna(val) or val == self.missing_value:
-            return pd.NA
-        s = str(val).strip()
-
-        s = re.split(r"\.| \| | - ", s)[0]
-        return s.strip()
+        return self._applyToValue(self._cleanLocationColumn, val)
 
-    def _cleanInstallments(self, val: str | float) -> float | pd.NA:
+    def _cleanInstallments(self, val: str | float) -> float:
         """
-        Normalize installment string to float value in IDR.
+        Normalize installment string to float value in IDR (NaN if invalid).
 
         Handles:
         - 'Rp 8,9 jt/bulan' -> 8.9e6
         - '8.900.000' -> 8.9e6
         """
-        if pd.isna(val) or val == self.missing_value:
-            return pd.NA
-
-        s = re.sub(r"[^0-9,\.]", "", str(val).lower())
-        if not s:
-            logger.debug(f"[_cleanInstallments] Failed to convert value: {val!r}")
-            return pd.NA
-
-        # Handle both "8,9" and "8.9" style
-        if "," in s and "." in s:
-            # Likely thousand + decimal combo, assume "." is thousand sep
-            s = s.replace(".", "").replace(",", ".")
-        else:
-            # Single separator, treat comma as decimal
-            s = s.replace(",", ".")
-
-        try:
-            base = float(s)
-            return base * 1_000_000
-        except ValueError:
-            logger.debug(f"[_cleanInstallments] ValueError converting: {val!r}")
-            return pd.NA
+        return self._applyToValue(self._cleanInstallmentsColumn, val)
 
     # --
-    def _estimateInstallment(self, price: float | pd.NA) -> float | pd.NA:
+    def _estimateInstallment(self, price: float) -> float:
         """
-        Estimate monthly installment based on price:
+        Estimate monthly installment based on price (NaN if price is invalid):
         - 30% down payment, 11% other costs, 20% interest, 36 months tenor
         """
-        if pd.isna(price):
-            return pd.NA
+        return self._applyToValue(self._estimateInstallmentColumn, price)
 
-        try:
-            price_val = float(price)
-        except (TypeError, ValueError):
-            logger.debug(f"[_estimateInstallment] Invalid price: {price}")
-            return pd.NA
-
-        if price_val <= 0:
-            return pd.NA
-
-        down_payment = 0.3 * price_val
-        other_costs = 0.11 * price_val
-        loan = (price_val - down_payment) + other_costs
-        interest = 0.20 * loan
-        tenor = 36
+    def _transformPostedTime(self, val: str) -> str | pd.NA:
+        """
+        Validate posted_time string (max 7 chars).
+        """
+        return self._applyToValue(self._transformPostedTimeColumn, val)
 
-        installment = (loan + interest) / tenor
-        est = round(installment, 2)
+    # --- Input / output ---
+    def _readInput(self, parsed_path: str) -> pd.DataFrame:
+        """
+        Read the parsed CSV. Uses pyarrow's multi-threaded reader when
+        installed, else pandas.read_csv.
 
-        logger.debug(
-            f"[_estimateInstallment] price={price_val:.0f} → estimated_installment={est:.2f}"
+        With pyarrow every column is read as text (the parser only writes
+        strings) and the pandas null tokens map to missing values.
+        """
+        if pa is None:
+            return pd.read_csv(parsed_path)
+
+        with open(parsed_path, "rb") as f:
+            header = f.readline().decode("utf-8").strip()
+        column_names = next(csv.reader([header])) if header else []
+
+        table = pa_csv.read_csv(
+            parsed_path,
+            read_options=pa_csv.ReadOptions(use_threads=True),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={c: pa.string() for c in column_names},
+                null_values=_CSV_NULL_VALUES,
+                strings_can_be_null=True,
+            ),
         )
-        return est
+        return table.to_pandas()
 
-    def _transformPostedTime(self, val: str) -> str | pd.NA:
+    # --- Output ---
+    def _writeOutput(self, df: pd.DataFrame, transformed_path: str) -> None:
         """
-        Validate posted_time string (max 7 chars).
+        Write the transformed frame: Parquet if the path ends in '.parquet',
+        otherwise CSV. Uses pyarrow's writers when installed, else pandas
+        (CSV written in CSV_CHUNK_SIZE-row batches).
         """
-        if pd.isna(val) or val == self.missing_value:
-            return pd.NA
-        s = str(val).strip()
-
-        if len(s) > 7:
-            logger.debug(f"[_transformPostedTime] Invalid range: {val!r}")
-            return pd.NA
-        return s
+        if transformed_path.endswith(".parquet"):
+            df.to_parquet(transformed_path, index=False)
+        elif pa is not None:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pa_csv.write_csv(table, transformed_path)
+        else:
+            df.to_csv(
+                transformed_path,
+                index=False,
+                encoding="utf-8",
+                chunksize=CSV_CHUNK_SIZE,
+            )
 
     # --- Main transform workflow ---
     def transform(self, parsed_data: pd.DataFrame | str, transformed_path: str) -> None:
@@ -204,7 +360,7 @@ class ETLTransformer:
         1) Load input CSV or DataFrame
         2) Apply cleaning & enrichment
         3) Impute missing installments based on price
-        4) Save transformed CSV
+        4) Save transformed CSV (or Parquet, see _writeOutput)
         """
         logger.info("[Transform] Start transform")
 
@@ -217,7 +373,7 @@ class ETLTransformer:
                 if not os.path.exists(parsed_data):
                     raise FileNotFoundError(f"[Transform] No file {parsed_data}")
                 logger.debug(f"[Transform] Reading parsed CSV from: {parsed_data}")
-                df = pd.read_csv(parsed_data)
+                df = self._readInput(parsed_data)
 
             logger.debug(f"[Transform] Initial columns: {list(df.columns)}")
 
@@ -237,30 +393,34 @@ class ETLTransformer:
                 )
 
             # --- 2) Apply transformations ---
-            df["price"] = df["price"].apply(self._cleanPrice)
+            df["price"] = self._cleanPriceColumn(df["price"])
 
             # Extract year, lower_km, upper_km from year_mileage
-            year_km_df = df["year_mileage"].apply(self._parseYearMileage)
-            year_km_df.columns = ["year", "lower_km", "upper_km"]
+            year_km_df = self._parseYearMileageColumn(df["year_mileage"])
             df[["year", "lower_km", "upper_km"]] = year_km_df
 
             df = df.drop(columns=["year_mileage"])
 
-            df["listing_url"] = df["listing_url"].apply(self._enrichURL)
-            df["location"] = df["location"].apply(self._cleanLocation)
-            df["installment"] = df["installment"].apply(self._cleanInstallments)
-            df["posted_time"] = df["posted_time"].apply(self._transformPostedTime)
+            df["listing_url"] = self._enrichURLColumn(df["listing_url"])
+            # Low-cardinality text: cleaned per distinct value, kept categorical
+            df["location"] = self._cleanCategorical(
+                df["location"], self._cleanLocationColumn
+            )
+            df["installment"] = self._cleanInstallmentsColumn(df["installment"])
+            df["posted_time"] = self._cleanCategorical(
+                df["posted_time"], self._transformPostedTimeColumn
+            )
 
             # --- 3) Impute missing installments based on price ---
             # default flags: all False (not imputed)
-            df["installment_imputed"] = False
+            df["installment_imputed"] = pd.Series(False, index=df.index, dtype=bool)
             missing_mask = df["installment"].isna()
 
             if missing_mask.any():
                 # Compute installment for missing rows
-                df.loc[missing_mask, "installment"] = df.loc[
-                    missing_mask, "price"
-                ].apply(self._estimateInstallment)
+                df.loc[missing_mask, "installment"] = self._estimateInstallmentColumn(
+                    df.loc[missing_mask, "price"]
+                )
 
                 # Update flag only for rows successfully imputed
                 imputed_ok = missing_mask & df["installment"].notna()
@@ -276,11 +436,8 @@ class ETLTransformer:
             logger.debug(f"[Transform] Dtypes after transform:\n{df.dtypes}")
 
             # --- 4) Save transformed CSV ---
-            out_dir = os.path.dirname(transformed_path)
-            if out_dir:
-                os.makedirs(out_dir, exist_ok=True)
-
-            df.to_csv(transformed_path, index=False, encoding="utf-8")
+            ensure_dirs(transformed_path)
+            self._writeOutput(df, transformed_path)
 
             logger.info(
                 f"[Transform] Completed: {len(df)} rows saved to {transformed_path}"
@@ -0,0 +1,58 @@
+# source/etl/utils/etl_paths.py
+
+"""
+Default file layout for pipeline artifacts, and one-shot creation of their
+directories.
+Used by:
+- engine.py (batch runs and CLI)
+- scraps.py (Luigi batch task)
+- scraper, parser, transformer and loader (before each write)
+"""
+
+import os
+
+# Directories already created by this process (absolute paths)
+_ENSURED_DIRS: set[str] = set()
+
+
+def keyword_slug(keyword: str) -> str:
+    """
+    Short file-name slug for a keyword, e.g. "BMW 3 Series" -> "bmw_3_series".
+    """
+    return keyword.strip().replace(" ", "_").lower()
+
+
+def default_paths(keyword: str) -> dict[str, str]:
+    """
+    Build the default artifact paths for one keyword.
+
+    Returns a dict with html_path, parsed_path, transformed_path and
+    inserted_path, matching the data/ layout used by run_pipeline.sh.
+    """
+    slug = keyword_slug(keyword)
+    return {
+        "html_path": f"data/raw_html/{slug}.html",
+        "parsed_path": f"data/parsed/{slug}.csv",
+        "transformed_path": f"data/transformed/{slug}_transformed.csv",
+        "inserted_path": f"data/inserted/{slug}_inserted.json",
+    }
+
+
+def ensure_dirs(*paths: str | None) -> None:
+    """
+    Create the parent directories of the given file paths. None entries
+    (e.g. a skipped inserted_path) are ignored.
+
+    Directories already created by this process are only checked with one
+    isdir() stat instead of a full os.makedirs() walk, so every write site
+    can call this cheaply; one removed since (e.g. a cleaned data/ folder)
+    is simply created again.
+    """
+    for path in paths:
+        if not path:
+            continue
+        dir_path = os.path.dirname(os.path.abspath(path))
+        if dir_path in _ENSURED_DIRS and os.path.isdir(dir_path):
+            continue
+        os.makedirs(dir_path, exist_ok=True)
+        _ENSURED_DIRS.add(dir_path)
@@ -4,13 +4,13 @@
 Selectors & constants for OLX scraping/parsing.
 Used by:
 - Playwright scraper
-- BeautifulSoup parser
+- selectolax parser
 """
 
 # Base URL OLX
 BASE_URL = "https://www.olx.co.id"
 
-# CSS selectors for Playwright (and can be reused by BeautifulSoup .select)
+# CSS selectors for Playwright (and reused by the selectolax parser)
 LOCATION_INPUT = "div[data-aut-id='locationBox'] input"
 LOCATION = "div[data-aut-id='locationItem'] b"
 ITEM = "li[data-aut-id='itemBox']"
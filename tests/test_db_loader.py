@@ -0,0 +1,276 @@
+# tests/test_db_loader.py
+
+import json
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+from loguru import logger
+
+from source.etl import db_loader
+from source.etl.db_loader import (
+    DBLoader,
+    StringIteratorIO,
+    _csv_lines,
+    _db_values,
+    _iter_parquet,
+    _JsonArrayWriter,
+)
+from source.etl.etl_transformer import MISSING_VALUE, ETLTransformer
+
+
+def test_normalize_frame_year_and_missing():
+    df = pd.DataFrame(
+        {
+            "title": ["Toyota Calya", None],
+            "price": [150_000_000.0, np.nan],
+            "year": [2018.0, "bukan angka"],
+        }
+    )
+
+    out = DBLoader._normalize_frame(df)
+
+    # Numeric columns stay typed, only object columns hold None
+    assert out["price"].dtype == "float64"
+    assert out["year"].dtype == "Int64"
+    assert out["year"].tolist() == [2018, pd.NA]
+    assert out["title"].tolist() == ["Toyota Calya", None]
+    assert np.isnan(out.loc[1, "price"])
+
+
+def test_csv_lines_quotes_strings_and_marks_null():
+    df = pd.DataFrame(
+        {
+            "title": ['Calya "G", 2018', None],
+            "price": [None, 1.5],
+            "year": pd.array([2018, None], dtype="Int64"),
+        }
+    )
+
+    lines = list(_csv_lines(df))
+
+    assert lines == ['"Calya ""G"", 2018",\\N,2018\n', "\\N,1.5,\\N\n"]
+
+
+def test_string_iterator_io_reads_in_chunks():
+    stream = StringIteratorIO(iter(["abc", "", "defg\n", "h"]))
+
+    assert stream.read(2) == "ab"
+    assert stream.read(4) == "cdef"
+    assert stream.read() == "g\nh"
+    assert stream.read(10) == ""
+
+
+def test_iter_chunks_reads_only_db_columns(tmp_path):
+    csv_path = tmp_path / "transformed.csv"
+    pd.DataFrame(
+        [
+            {"title": "2018", "price": 1.0, "year": 2018, "installment_imputed": True},
+            {
+                "title": "Calya",
+                "price": None,
+                "year": None,
+                "installment_imputed": False,
+            },
+        ]
+    ).to_csv(csv_path, index=False)
+
+    chunks = list(DBLoader._iter_chunks(str(csv_path)))
+    records = _db_values(pd.concat(chunks)).to_dict(orient="records")
+
+    # Kolom helper tidak ikut dibaca, title tetap string
+    assert records == [
+        {"title": "2018", "price": 1.0, "year": 2018},
+        {"title": "Calya", "price": None, "year": None},
+    ]
+
+
+def test_iter_chunks_leaves_caller_frame_untouched():
+    df = pd.DataFrame(
+        {"title": ["Calya"], "year": [2018.5], "installment_imputed": [True]}
+    )
+    before = df.copy()
+
+    list(DBLoader._iter_chunks(df))
+
+    pd.testing.assert_frame_equal(df, before)
+
+
+def _mock_engine():
+    engine = mock.MagicMock()
+    engine.dialect.identifier_preparer.quote = lambda name: f'"{name}"'
+    return engine
+
+
+def test_drop_secondary_indexes_returns_definitions():
+    cur = mock.MagicMock()
+    cur.fetchall.return_value = [
+        ("public.idx_price", "CREATE INDEX idx_price ON public.scrape_data (price)"),
+    ]
+
+    indexdefs = DBLoader._drop_secondary_indexes(cur, _mock_engine(), "scrape_data")
+
+    query, params = cur.execute.call_args_list[0].args
+    assert "NOT ix.indisunique" in query
+    assert params == ('"scrape_data"',)
+    cur.execute.assert_called_with("DROP INDEX public.idx_price")
+    assert indexdefs == ["CREATE INDEX idx_price ON public.scrape_data (price)"]
+
+
+def test_copy_chunks_drops_indexes_past_threshold(monkeypatch):
+    monkeypatch.setattr(db_loader, "DROP_INDEXES_MIN_ROWS", 2)
+    monkeypatch.setattr(DBLoader, "_copy_frame", staticmethod(mock.Mock()))
+    drop = mock.Mock(return_value=["CREATE INDEX idx_price ON scrape_data (price)"])
+    monkeypatch.setattr(DBLoader, "_drop_secondary_indexes", staticmethod(drop))
+    engine = _mock_engine()
+    chunks = [pd.DataFrame({"price": [1.0, 2.0]}), pd.DataFrame({"price": [3.0]})]
+
+    dropped: list[str] = []
+    n_rows = DBLoader("unused")._copy_chunks(
+        engine, iter(chunks), "scrape_data", None, dropped
+    )
+
+    # Dropped once, just before the chunk that crosses the threshold
+    assert n_rows == 3
+    drop.assert_called_once()
+    assert DBLoader._copy_frame.call_count == 2
+    assert dropped == ["CREATE INDEX idx_price ON scrape_data (price)"]
+    engine.raw_connection.return_value.commit.assert_called_once()
+
+
+def test_recreate_indexes_caps_workers_and_reports_failures(monkeypatch):
+    engine = _mock_engine()
+    conn = engine.connect.return_value.execution_options.return_value.__enter__()
+    cur = conn.connection.driver_connection.cursor.return_value
+
+    def _execute(sql):
+        if sql.startswith("BAD"):
+            raise ValueError("syntax error")
+
+    cur.execute.side_effect = _execute
+    pool = mock.MagicMock(wraps=db_loader.ThreadPoolExecutor)
+    monkeypatch.setattr(db_loader, "ThreadPoolExecutor", pool)
+    indexdefs = [f"CREATE INDEX idx_{i} ON scrape_data (c{i})" for i in range(7)]
+
+    with pytest.raises(RuntimeError, match="BAD INDEX"):
+        DBLoader._recreate_indexes(engine, indexdefs + ["BAD INDEX"])
+
+    assert pool.call_args.kwargs["max_workers"] == db_loader.POOL_SIZE
+    assert cur.execute.call_count == 8
+
+
+def test_iter_chunks_nulls_malformed_numbers(tmp_path):
+    csv_path = tmp_path / "transformed.csv"
+    csv_path.write_text("title,price,year\na,1.0,2018\nb,abc,xyz\n")
+
+    df = pd.concat(list(DBLoader._iter_chunks(str(csv_path))))
+
+    # Satu sel rusak hanya jadi NULL, baris lain tetap termuat
+    assert df["price"].dtype == "float64"
+    assert df["year"].dtype == "Int64"
+    assert df["year"].tolist() == [2018, pd.NA]
+    assert df["price"].iloc[0] == 1.0
+    assert np.isnan(df["price"].iloc[1])
+
+
+def test_normalize_frame_warns_once_for_bad_csv_year(tmp_path):
+    csv_path = tmp_path / "transformed.csv"
+    csv_path.write_text("title,year\na,2018\nb,bukan angka\n")
+    warnings: list[str] = []
+    sink_id = logger.add(warnings.append, level="WARNING")
+
+    try:
+        df = pd.concat(list(DBLoader._iter_chunks(str(csv_path))))
+    finally:
+        logger.remove(sink_id)
+
+    assert df["year"].tolist() == [2018, pd.NA]
+    assert len(warnings) == 1
+    assert "1 invalid 'year' values set to NULL" in warnings[0]
+
+
+def test_parquet_round_trip_keeps_types_and_nulls(tmp_path):
+    pytest.importorskip("pyarrow")
+    parquet_path = str(tmp_path / "transformed.parquet")
+    parsed = pd.DataFrame(
+        [
+            {
+                "title": "Toyota Calya",
+                "price": "Rp 150.000.000",
+                "listing_url": "/item/toyota-calya-2018-iid-123",
+                "location": "Duren Sawit, Jakarta Timur",
+                "posted_time": "26 Nov",
+                "installment": "Rp 3,5 jt/bulan",
+                "year_mileage": "2018 - 70.000-75.000 km",
+            },
+            {
+                "title": "Honda Jazz",
+                "price": MISSING_VALUE,
+                "listing_url": MISSING_VALUE,
+                "location": MISSING_VALUE,
+                "posted_time": MISSING_VALUE,
+                "installment": MISSING_VALUE,
+                "year_mileage": MISSING_VALUE,
+            },
+        ]
+    )
+    ETLTransformer().transform(parsed, parquet_path)
+
+    raw = pd.concat(list(_iter_parquet(parquet_path)), ignore_index=True)
+
+    # Kolom helper tidak ikut, tipe angka dari Parquet tetap
+    assert "installment_imputed" not in raw.columns
+    assert raw["price"].dtype == "float64"
+    assert raw["year"].dtype == "Int32"
+    assert raw["location"].dtype == object
+    assert raw["year"].tolist() == [2018, pd.NA]
+    assert raw["installment"].tolist()[0] == 3_500_000.0
+    assert raw[["price", "installment", "lower_km"]].iloc[1].isna().all()
+
+    records = pd.concat(list(DBLoader._iter_chunks(parquet_path)))
+    records = _db_values(records).to_dict(orient="records")
+    assert records[0]["year"] == 2018
+    assert records[1] == {
+        "title": "Honda Jazz",
+        "price": None,
+        "listing_url": None,
+        "location": None,
+        "installment": None,
+        "posted_time": None,
+        "year": None,
+        "lower_km": None,
+        "upper_km": None,
+    }
+
+
+def test_json_array_writer_empty_and_multiple_chunks(tmp_path):
+    empty_path = tmp_path / "empty.json"
+    with _JsonArrayWriter(str(empty_path)) as audit:
+        audit.write([])
+
+    with open(empty_path, encoding="utf-8") as f:
+        assert json.load(f) == []
+
+    path = tmp_path / "inserted.json"
+    with _JsonArrayWriter(str(path)) as audit:
+        audit.write([{"title": "Calya", "year": np.int64(2018)}])
+        audit.write([])
+        audit.write([{"title": "Jazz", "year": None}, {"title": "BMW", "year": 2020}])
+
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f) == [
+            {"title": "Calya", "year": 2018},
+            {"title": "Jazz", "year": None},
+            {"title": "BMW", "year": 2020},
+        ]
+
+
+def test_json_array_writer_removes_part_file_on_error(tmp_path):
+    part_path = tmp_path / "inserted.json.part"
+
+    with pytest.raises(RuntimeError), _JsonArrayWriter(str(part_path)) as audit:
+        audit.write([{"title": "Calya"}])
+        raise RuntimeError("COPY failed")
+
+    assert not part_path.exists()
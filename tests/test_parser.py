@@ -1,8 +1,10 @@
 # tests/test_parser.py
 
+from datetime import date
+
 import pandas as pd
 
-from source.etl.etl_parser import parse_html
+from source.etl.etl_parser import MISSING_VALUE, _convert_to_date, parse_html
 
 
 def test_parse_html_basic(tmp_path):
@@ -47,3 +49,33 @@ def test_parse_html_basic(tmp_path):
     assert row["posted_time"] == "26 Nov"
     assert "8,9" in row["installment"]
     assert "2018" in row["year_mileage"]
+
+
+def test_convert_to_date_relative_texts():
+    today = date(2025, 3, 1)
+
+    assert _convert_to_date("Hari ini", today) == "1 Mar"
+    assert _convert_to_date("Kemarin", today) == "28 Feb"
+    assert _convert_to_date("4 hari yang lalu", today) == "25 Feb"
+    assert _convert_to_date("18 Nov", today) == "18 Nov"
+
+
+def test_parse_html_valueless_href(tmp_path):
+    html = """
+    <ul>
+      <li data-aut-id="itemBox">
+        <a href></a>
+        <span data-aut-id="itemTitle">Honda Jazz</span>
+      </li>
+      <li data-aut-id="itemBox">
+        <a href=""></a>
+        <span data-aut-id="itemTitle">BMW 320i</span>
+      </li>
+    </ul>
+    """
+
+    out_csv = tmp_path / "parsed.csv"
+    parse_html(html, str(out_csv))
+
+    df = pd.read_csv(out_csv, keep_default_na=False)
+    assert df["listing_url"].tolist() == [MISSING_VALUE, MISSING_VALUE]
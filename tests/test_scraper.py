@@ -0,0 +1,86 @@
+# tests/test_scraper.py
+
+import os
+import time
+
+import pytest
+
+from source.etl.etl_scraper import _cache_key, _save_html, is_html_fresh
+from source.etl.utils.etl_paths import default_paths
+
+
+@pytest.fixture
+def scraps(tmp_path, monkeypatch):
+    # Importing scraps configures logging into ./logs: keep it in tmp_path
+    monkeypatch.chdir(tmp_path)
+    import scraps
+
+    return scraps
+
+
+def _age(path, seconds: float) -> None:
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def test_is_html_fresh_within_ttl(tmp_path):
+    html_path = str(tmp_path / "raw_html" / "calya.html")
+    _save_html(html_path, "<html></html>", _cache_key("Toyota Calya", "Indonesia"))
+
+    assert is_html_fresh(html_path, "Toyota Calya", ttl_seconds=60)
+
+    # Lebih tua dari TTL -> harus scrape ulang
+    _age(html_path, 120)
+    assert not is_html_fresh(html_path, "Toyota Calya", ttl_seconds=60)
+
+
+def test_is_html_fresh_rejects_other_search(tmp_path):
+    html_path = str(tmp_path / "calya.html")
+    _save_html(html_path, "<html></html>", _cache_key("Toyota Calya", "Indonesia"))
+
+    assert not is_html_fresh(html_path, "Honda Jazz", ttl_seconds=60)
+    assert not is_html_fresh(html_path, "Toyota Calya", "Bandung", ttl_seconds=60)
+
+
+def test_is_html_fresh_missing_sidecar_or_disabled(tmp_path):
+    html_path = tmp_path / "calya.html"
+    html_path.write_text("<html></html>")
+
+    # Tanpa file .sha1 tidak dianggap cache
+    assert not is_html_fresh(str(html_path), "Toyota Calya", ttl_seconds=60)
+
+    _save_html(str(html_path), "<html></html>", _cache_key("Toyota Calya", "Indonesia"))
+    assert not is_html_fresh(str(html_path), "Toyota Calya", ttl_seconds=0)
+
+
+def test_scrape_complete_follows_cache_setting(scraps, tmp_path, monkeypatch):
+    html_path = str(tmp_path / "calya.html")
+    task = scraps.Scrape(keyword="Toyota Calya", html_path=html_path)
+    assert not task.complete()
+
+    _save_html(html_path, "<html></html>", _cache_key("Toyota Calya", "Indonesia"))
+    assert task.complete()
+
+    _age(html_path, scraps.HTML_CACHE_TTL_SECONDS + 60)
+    assert not task.complete()
+
+    # Cache off: selesai cukup karena file output ada
+    monkeypatch.setattr(scraps, "HTML_CACHE_TTL_SECONDS", 0)
+    assert task.complete()
+
+
+def test_scrape_batch_complete_needs_every_keyword(scraps, monkeypatch):
+    keywords = ["Toyota Calya", "Honda Jazz"]
+    task = scraps.ScrapeBatch(keywords=keywords)
+
+    calya_path = default_paths("Toyota Calya")["html_path"]
+    _save_html(calya_path, "<html></html>", _cache_key("Toyota Calya", "Indonesia"))
+    assert not task.complete()
+
+    jazz_path = default_paths("Honda Jazz")["html_path"]
+    _save_html(jazz_path, "<html></html>", _cache_key("Toyota Calya", "Indonesia"))
+    # Sidecar milik pencarian lain
+    assert not task.complete()
+
+    monkeypatch.setattr(scraps, "HTML_CACHE_TTL_SECONDS", 0)
+    assert task.complete()
@@ -18,14 +18,26 @@ def test_clean_price_basic():
 def test_parse_year_mileage_range():
     tr = ETLTransformer()
 
-    series = tr._parseYearMileage("2018 - 70.000-75.000 km")
-    year, lower_km, upper_km = series.tolist()
+    year, lower_km, upper_km = tr._parseYearMileage("2018 - 70.000-75.000 km")
 
     assert year == 2018
     assert lower_km == 70000.0
     assert upper_km == 75000.0
 
 
+def test_parse_year_mileage_column_dtypes():
+    tr = ETLTransformer()
+    col = pd.Series(["2020 • 10.000 km", MISSING_VALUE, None])
+
+    out = tr._parseYearMileageColumn(col)
+
+    assert out["year"].dtype == "Int32"
+    assert out["lower_km"].dtype == "float64"
+    assert out["year"].tolist() == [2020, pd.NA, pd.NA]
+    # Single mileage fills both bounds
+    assert out.loc[0, "upper_km"] == out.loc[0, "lower_km"] == 10000.0
+
+
 def test_estimate_installment_formula():
     tr = ETLTransformer()
     price = 500_000_000
@@ -100,3 +112,55 @@ def test_full_transform_one_row(tmp_path):
     # Installment di-impute dan > 0
     assert row["installment"] > 0
     assert bool(row["installment_imputed"]) is True
+
+
+def test_clean_categorical_all_missing():
+    tr = ETLTransformer()
+    col = pd.Series([float("nan"), float("nan")])
+
+    out = tr._cleanCategorical(col, tr._cleanLocationColumn)
+
+    assert out.dtype == "category"
+    assert out.isna().all()
+    assert out.index.equals(col.index)
+
+
+def test_clean_installments_column_duplicate_index():
+    tr = ETLTransformer()
+    # e.g. pd.concat of two parsed frames
+    col = pd.Series(
+        ["Rp 8,9 jt/bulan", "Rp 3,5 jt/bulan", "Rp 4 jt/bulan", MISSING_VALUE],
+        index=[0, 0, 1, 1],
+    )
+
+    out = tr._cleanInstallmentsColumn(col)
+
+    assert out.index.tolist() == [0, 0, 1, 1]
+    assert out.iloc[:3].tolist() == [8.9e6, 3.5e6, 4e6]
+    assert pd.isna(out.iloc[3])
+
+
+def test_transform_from_csv_matches_pandas_read(tmp_path):
+    parsed_csv = tmp_path / "parsed.csv"
+    parsed_csv.write_text(
+        "title,price,listing_url,location,posted_time,installment,year_mileage\n"
+        '"Toyota Calya, G",Rp 150.000.000,/item/a,"Duren Sawit, Jakarta Timur",'
+        "26 Nov,data not found,2018 - 70.000-75.000 km\n"
+        'Honda Jazz,,/item/b,,Kemarin,"Rp 3,5 jt/bulan",data not found\n'
+        "NA,data not found,,Bandung,,,2020 • 10.000 km\n",
+        encoding="utf-8",
+    )
+    tr = ETLTransformer()
+
+    # Path input uses _readInput (pyarrow when installed)
+    tr.transform(str(parsed_csv), str(tmp_path / "from_path.csv"))
+    # Reference: the frame pandas.read_csv produces
+    tr.transform(pd.read_csv(parsed_csv), str(tmp_path / "from_pandas.csv"))
+
+    from_path = pd.read_csv(tmp_path / "from_path.csv")
+    from_pandas = pd.read_csv(tmp_path / "from_pandas.csv")
+    pd.testing.assert_frame_equal(from_path, from_pandas)
+
+    assert from_path["title"].iloc[0] == "Toyota Calya, G"
+    assert from_path["installment"].iloc[1] == 3_500_000.0
+    assert from_path["location"].isna().iloc[1]